@@ -0,0 +1,137 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains the command-line entry point for the
+#                  benchmarks.
+#
+#                  python -m benchmarks run [-o results.json] [-k NAME ...]
+#                  python -m benchmarks compare baseline.json results.json
+#                  python -m benchmarks macro [--scale 0.01] [-w NAME ...]
+#                  python -m benchmarks memory [--budget 4.0] [--size N ...]
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+from benchmarks import macro, memory, micro
+from sha256.core.engines import ENGINES
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+def _run(args: argparse.Namespace) -> int:
+    report = micro.run(args.k, args.repeat, args.warmup, args.min_time)
+    for name, stats in report["results"].items():
+        print(f"{name:32} {_format_time(stats['median'])}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            return _report(micro.compare(json.load(f), report, args.threshold))
+    return 0
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    return _report(micro.compare(baseline, current, args.threshold))
+
+def _macro(args: argparse.Namespace) -> int:
+    report = macro.run(args.w, args.engine, args.scale)
+    failed = 0
+    for name, stats in report["results"].items():
+        status = "ok" if stats["correct"] else "WRONG RESULT"
+        failed += not stats["correct"]
+        print(f"{name:32} {stats['seconds']:9.2f} s {stats['bytes_per_second'] / 1e3:10.1f} kB/s "
+              f"{stats['hashes_per_second']:10.1f} H/s  {status}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if failed else 0
+
+def _memory(args: argparse.Namespace) -> int:
+    report = memory.run(args.size or memory.SIZES, args.engine, args.budget, args.top)
+    failed = 0
+    for name, stats in report["results"].items():
+        status = "ok" if stats["within_budget"] else "OVER BUDGET"
+        failed += not stats["within_budget"]
+        print(f"{name:32} peak {stats['peak'] / 1e3:10.1f} kB {stats['peak_per_byte']:8.3f} B/B "
+              f"{stats['words_per_block']:8.0f} words/block  {status}")
+        for site in stats["sites"]:
+            print(f"    {site['site']:48} {site['size'] / 1e3:10.1f} kB {site['count']:8} allocs")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if failed else 0
+
+def _report(rows: List[dict]) -> int:
+    # prints a comparison table; non-zero if anything regressed
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else ""
+        print(f"{row['name']:32} {_format_time(row['baseline'])} -> {_format_time(row['current'])} "
+              f"({row['ratio']:5.2f}x) {flag}")
+    regressed = [row["name"] for row in rows if row["regressed"]]
+    if regressed:
+        print(f"{len(regressed)} benchmark(s) regressed: {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    return 0
+
+def main(argv: Optional[List[str]]=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the micro-benchmarks")
+    run.add_argument("-k", action="append", metavar="NAME",
+                     help="only run benchmarks whose name contains NAME (repeatable)")
+    run.add_argument("-o", "--output", help="write the JSON results to this file")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--min-time", type=float, default=0.05,
+                     help="shortest duration of a timed repetition, in seconds")
+    run.add_argument("--baseline", help="compare against this saved JSON baseline")
+    run.add_argument("--threshold", type=float, default=0.1,
+                     help="tolerated slowdown as a fraction (default: 0.1)")
+    run.set_defaults(func=_run)
+
+    compare = sub.add_parser("compare", help="compare two saved JSON results")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=0.1,
+                         help="tolerated slowdown as a fraction (default: 0.1)")
+    compare.set_defaults(func=_compare)
+
+    workloads = sub.add_parser("macro", help="run the macro workloads")
+    workloads.add_argument("-w", action="append", choices=sorted(macro.WORKLOADS),
+                           help="only run this workload (repeatable)")
+    workloads.add_argument("--engine", action="append", choices=sorted(ENGINES),
+                           help="only run on this engine (repeatable)")
+    workloads.add_argument("--scale", type=float, default=1.0,
+                           help="fraction of each full-size workload to run (default: 1.0)")
+    workloads.add_argument("-o", "--output", help="write the JSON results to this file")
+    workloads.set_defaults(func=_macro)
+
+    profile = sub.add_parser("memory", help="profile peak memory and allocations")
+    profile.add_argument("--size", type=int, action="append",
+                         help="input size in bytes (repeatable; default: 4096 16384 65536)")
+    profile.add_argument("--engine", action="append", choices=sorted(ENGINES),
+                         help="profile this engine (repeatable; default: uint32)")
+    profile.add_argument("--budget", type=float, default=memory.BUDGET,
+                         help=f"largest peak memory per input byte (default: {memory.BUDGET})")
+    profile.add_argument("--top", type=int, default=5, help="allocation sites to report")
+    profile.add_argument("-o", "--output", help="write the JSON results to this file")
+    profile.set_defaults(func=_memory)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains the macro workloads: the NIST million-'a'
+#                  and extremely-long-message vectors and the SHAVS Monte
+#                  Carlo chain. Each one is timed on every engine and its
+#                  result is checked.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+import hashlib
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+from sha256.core.engines import ENGINES, Engine
+from sha256.sha256 import Sha256
+
+# the pattern of the NIST extremely-long-message vector, repeated 2**24 times
+# (1 GiB); fed in 64 KiB chunks
+LONG_PATTERN = b"abcdefghbcdefghicdefghijdefghijkefghijklfghijklmghijklmnhijklmno"
+LONG_REPEAT = 2**24
+LONG_DIGEST = "50e72a0e26442fe2552dc3938ac58658228c0cbfb1d2ca872ae435266fcd055e"
+
+MILLION_A_DIGEST = "cdc76e5c9914fb9281a1c7e284d73e67f1809a48a497200e046d39ccc7112cd0"
+
+# SHAVS Monte Carlo seed and the digest after the final (100th) checkpoint
+MONTE_SEED = "6d1e72ad03ddeb5de891e572e2396f8da015d899ef0e79503152d6010a3fe691"
+MONTE_CHECKPOINTS = 100
+MONTE_DIGEST = "6a912ba4188391a78e6f13d88ed2d14e13afce9db6f7dcbf4a48c24f3db02778"
+
+class Workload(NamedTuple):
+    """
+    A sustained hashing load. 'run' computes the hex result on an engine,
+    and 'expected' is what it must return.
+
+    """
+
+    name: str
+    nbytes: int
+    nhashes: int
+    run: Callable[[Engine], str]
+    expected: str
+
+def million_a(scale: float=1.0) -> Workload:
+    """
+    One hash of 1,000,000 repetitions of 'a' (or a fraction of it).
+
+    """
+
+    n = int(1_000_000 * scale)
+    data = b"a" * n
+    expected = MILLION_A_DIGEST if n == 1_000_000 else hashlib.sha256(data).hexdigest()
+    return Workload("million-a", n, 1, lambda engine: Sha256(data, engine).hexdigest(), expected)
+
+def _stream(repeat: int) -> Callable[[object], str]:
+    # streams LONG_PATTERN * repeat through one hasher
+    def run(engine: Engine, hasher=Sha256) -> str:
+        h = hasher() if engine is None else hasher(engine=engine)
+        chunk = LONG_PATTERN * 1024
+        for _ in range(repeat // 1024):
+            h.update(chunk)
+        h.update(LONG_PATTERN * (repeat % 1024))
+        return h.hexdigest()
+    return run
+
+def long_message(scale: float=1.0) -> Workload:
+    """
+    One hash of the NIST extremely-long message, 'abcdefgh...' repeated
+    2**24 times (1 GiB), streamed in chunks so memory use stays constant.
+
+    """
+
+    repeat = int(LONG_REPEAT * scale)
+    run = _stream(repeat)
+    if repeat == LONG_REPEAT:
+        expected = LONG_DIGEST
+    else:
+        expected = run(None, hashlib.sha256)
+    return Workload("long-message", repeat * len(LONG_PATTERN), 1, run, expected)
+
+def _monte(checkpoints: int) -> Callable[[object], str]:
+    # runs the SHAVS Monte Carlo chain, returning the last checkpoint
+    def run(engine: Engine, hasher=Sha256) -> str:
+        seed = bytes.fromhex(MONTE_SEED)
+        for _ in range(checkpoints):
+            a = b = c = seed
+            for _ in range(1000):
+                h = hasher() if engine is None else hasher(engine=engine)
+                h.update(a + b + c)
+                a, b, c = b, c, h.digest()
+            seed = c
+        return seed.hex()
+    return run
+
+def monte_carlo(scale: float=1.0) -> Workload:
+    """
+    The SHAVS Monte Carlo test: 100 checkpoints of 1,000 chained hashes, where
+    every message is the concatenation of the three previous digests.
+
+    """
+
+    checkpoints = max(1, int(MONTE_CHECKPOINTS * scale))
+    run = _monte(checkpoints)
+    if checkpoints == MONTE_CHECKPOINTS:
+        expected = MONTE_DIGEST
+    else:
+        expected = run(None, hashlib.sha256)
+    return Workload("monte-carlo", checkpoints * 1000 * 96, checkpoints * 1000, run, expected)
+
+WORKLOADS = {
+    "million-a": million_a,
+    "long-message": long_message,
+    "monte-carlo": monte_carlo,
+}
+
+def measure(workload: Workload, engine: Engine) -> Dict:
+    """
+    Runs a workload once on an engine.
+
+    Returns:
+        (Dict) The 'seconds' taken, the 'bytes_per_second' and
+            'hashes_per_second' rates, and whether the result was 'correct'.
+
+    """
+
+    began = time.perf_counter()
+    result = workload.run(engine)
+    seconds = time.perf_counter() - began
+    return {
+        "seconds": seconds,
+        "bytes_per_second": workload.nbytes / seconds,
+        "hashes_per_second": workload.nhashes / seconds,
+        "correct": result == workload.expected,
+    }
+
+def run(names: Optional[List[str]]=None, engines: Optional[List[str]]=None, scale: float=1.0) -> Dict:
+    """
+    Runs the macro workloads on the engines.
+
+    Args:
+        names: (List[str]) The workloads to run; all if not supplied.
+        engines: (List[str]) The engines to run on; all if not supplied.
+        scale: (float) The fraction of each full-size workload to run. Full
+            size is checked against the published vectors; anything smaller
+            against hashlib.
+
+    Returns:
+        (Dict) The results, keyed by '<workload>.<engine>'.
+
+    """
+
+    results = {}
+    for name in names or WORKLOADS:
+        workload = WORKLOADS[name](scale)
+        for engine_name in engines or sorted(ENGINES):
+            results[f"{name}.{engine_name}"] = measure(workload, ENGINES[engine_name])
+    return {"meta": {"scale": scale}, "results": results}
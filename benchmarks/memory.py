@@ -0,0 +1,125 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains the memory profiling harness, which hashes
+#                  inputs of increasing size under tracemalloc and reports
+#                  peak memory, word allocations per block and the top
+#                  allocation sites.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+import os
+import tracemalloc
+from typing import Dict, List, Optional, Sequence
+import sha256
+import sha256.sha256 as _sha256
+from sha256.core.engines import ENGINES, Engine
+from sha256.instrument import instrument
+
+# input sizes (in bytes) profiled by default
+SIZES = (4096, 16384, 65536)
+
+# the largest tolerated peak memory per input byte
+BUDGET = 4.0
+
+# allocation sites are reported relative to the directory holding the
+# package, so they read the same whatever the working directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(sha256.__file__)))
+
+# allocation sites are only reported from these files
+SITES = (
+    os.path.join("sha256", "sha256.py"),
+    os.path.join("sha256", "core", "ubitarray_32.py"),
+    os.path.join("sha256", "core", "uint_32.py"),
+)
+
+def _top_sites(snapshot: tracemalloc.Snapshot, limit: int) -> List[Dict]:
+    # the largest allocation sites in the files of interest
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(True, f"*{site}") for site in SITES])
+    return [
+        {
+            "site": f"{os.path.relpath(stat.traceback[0].filename, ROOT)}:{stat.traceback[0].lineno}",
+            "size": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+def profile(size: int, engine: Engine, limit: int=5) -> Dict:
+    """
+    Hashes 'size' bytes under tracemalloc.
+
+    The input is allocated before tracing starts, so it is not counted in the
+    peak. The allocation sites are read from a snapshot taken right after the
+    first block is compressed, while its schedule window and both contexts
+    are still alive.
+
+    Args:
+        size: (int) The input size in bytes.
+        engine: (Engine) The word engine to run on.
+        limit: (int) The number of allocation sites reported.
+
+    Returns:
+        (Dict) The 'peak' memory in bytes, the 'peak_per_byte' ratio, the
+            word allocations per block ('words_per_block') and the top
+            allocation 'sites'.
+
+    """
+
+    data = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+
+    with instrument() as report:
+        _sha256.SHA256(data, engine)
+    words_per_block = report.counts["words"] / report.counts["blocks"]
+
+    snapshots = []
+    compress = _sha256.compress
+    def snapshotting(*args, **kwargs):
+        ctx = compress(*args, **kwargs)
+        if not snapshots:
+            snapshots.append(tracemalloc.take_snapshot())
+        return ctx
+
+    _sha256.compress = snapshotting
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        _sha256.SHA256(data, engine)
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+        _sha256.compress = compress
+
+    return {
+        "peak": peak,
+        "peak_per_byte": peak / size if size else float(peak),
+        "words_per_block": words_per_block,
+        "sites": _top_sites(snapshots[0], limit),
+    }
+
+def run(sizes: Sequence[int]=SIZES, engines: Optional[List[str]]=None, budget: float=BUDGET,
+        limit: int=5) -> Dict:
+    """
+    Profiles every size on every engine.
+
+    Args:
+        sizes: (Sequence[int]) The input sizes in bytes.
+        engines: (List[str]) The engines to profile; 'uint32' if not
+            supplied.
+        budget: (float) The largest tolerated peak memory per input byte.
+        limit: (int) The number of allocation sites reported per run.
+
+    Returns:
+        (Dict) The results, keyed by '<engine>.<size>'; each also records
+            whether it stayed 'within_budget'.
+
+    """
+
+    results = {}
+    for name in engines or ["uint32"]:
+        for size in sizes:
+            stats = profile(size, ENGINES[name], limit)
+            stats["within_budget"] = stats["peak_per_byte"] <= budget
+            results[f"{name}.{size}"] = stats
+    return {"meta": {"budget": budget}, "results": results}
@@ -0,0 +1,194 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains the micro-benchmarks, which time each
+#                  hot-path primitive and SHA256 across input sizes.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Optional
+from sha256.core import bitops
+from sha256.core.engines import ENGINES, Engine
+from sha256.const import H
+from sha256.core.uint_32 import compress_block, toints, tobytes
+from sha256.fixed import hash32, hash64
+from sha256.sha256 import SHA256, _padding, schedule, compress
+
+# input sizes (in bytes) for the full-hash benchmarks
+SIZES = (0, 64, 1024, 16384)
+
+def _primitives(engine: Engine) -> Dict[str, Callable[[], object]]:
+    # one zero-argument callable per primitive of an engine
+    word = engine.word
+    x = word.fromint(0x9ca6a411)
+    y = word.fromint(0x1bc38230)
+    z = word.fromint(0x0000ae1f)
+    block = [word.fromint((i * 0x01010101) & 0xffffffff) for i in range(16)]
+    wds = schedule(list(block), engine)
+
+    return {
+        "fromint": lambda: word.fromint(0x9ca6a411),
+        "toint": x.toint,
+        "tohex": x.tohex,
+        "rotr": lambda: x.rotr(7),
+        "rshift": lambda: x.rshift(3),
+        "__add__": lambda: x + y,
+        "__xor__": lambda: x ^ y,
+        "ch": lambda: engine.ch(x, y, z),
+        "maj": lambda: engine.maj(x, y, z),
+        "lsig0": lambda: engine.lsig0(x),
+        "lsig1": lambda: engine.lsig1(x),
+        "usig0": lambda: engine.usig0(x),
+        "usig1": lambda: engine.usig1(x),
+        "schedule": lambda: schedule(list(block), engine),
+        "compress": lambda: compress(wds, None, engine),
+    }
+
+def _raw_hash(data: bytes) -> Callable[[], object]:
+    # the generic raw-integer path over 'data' padded by hand: one
+    # compress_block per block, plus the same word conversions hash32 and
+    # hash64 do; the baseline those two must beat
+    padded = data + _padding(len(data))
+    def run():
+        ctx = list(H)
+        for i in range(0, len(padded), 64):
+            compress_block(ctx, toints(padded[i:i+64]) + [0]*48)
+        return tobytes(ctx)
+    return run
+
+def benchmarks() -> Dict[str, Callable[[], object]]:
+    """
+    Returns:
+        (Dict[str, Callable]) Every micro-benchmark, keyed by name. Engine
+            primitives are named '<engine>.<primitive>', bit operations
+            'bitops.<function>', the fixed-length hashes 'fixed.hash32' and
+            'fixed.hash64' next to their 'raw.compress_block.<size>'
+            baselines, and full hashes 'SHA256.<engine>.<size>'.
+
+    """
+
+    a = bitops.prepad(bitops.binary(0x9ca6a411))
+    b = bitops.prepad(bitops.binary(0x1bc38230))
+    result = {
+        "bitops.binary": lambda: bitops.binary(0x9ca6a411),
+        "bitops.add": lambda: bitops.add(a, b),
+        "bitops.twos": lambda: bitops.twos(a),
+    }
+
+    result["raw.compress_block.32"] = _raw_hash(bytes(range(32)))
+    result["raw.compress_block.64"] = _raw_hash(bytes(range(64)))
+    result["fixed.hash32"] = lambda: hash32(bytes(range(32)))
+    result["fixed.hash64"] = lambda: hash64(bytes(range(64)))
+
+    for name, engine in sorted(ENGINES.items()):
+        for prim, fn in _primitives(engine).items():
+            result[f"{name}.{prim}"] = fn
+        for size in SIZES:
+            data = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+            result[f"SHA256.{name}.{size}"] = (lambda data, engine: lambda: SHA256(data, engine))(data, engine)
+
+    return result
+
+def measure(fn: Callable[[], object], repeat: int=5, warmup: int=1, min_time: float=0.05) -> Dict[str, float]:
+    """
+    Times a callable. After 'warmup' untimed calls, the number of calls per
+    repetition is calibrated so a repetition lasts at least 'min_time'
+    seconds, then 'repeat' repetitions are timed.
+
+    Args:
+        fn: (Callable) The zero-argument callable to time.
+        repeat: (int) The number of timed repetitions.
+        warmup: (int) The number of untimed calls made first.
+        min_time: (float) The shortest duration of a repetition, in seconds.
+
+    Returns:
+        (Dict[str, float]) The per-call 'min', 'median' and 'mean' times in
+            seconds, and the 'number' of calls per repetition.
+
+    """
+
+    for _ in range(warmup):
+        fn()
+
+    timer = timeit.Timer(fn, timer=time.perf_counter)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+
+    times = [t / number for t in timer.repeat(repeat, number)]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "number": number,
+        "repeat": repeat,
+    }
+
+def run(names: Optional[List[str]]=None, repeat: int=5, warmup: int=1, min_time: float=0.05) -> Dict:
+    """
+    Runs the micro-benchmarks.
+
+    Args:
+        names: (List[str]) Substrings selecting the benchmarks to run; all
+            are run if not supplied.
+        repeat, warmup, min_time: See 'measure'.
+
+    Returns:
+        (Dict) A JSON-serializable report with a 'meta' section describing
+            the machine and a 'results' section keyed by benchmark name.
+
+    """
+
+    results = {}
+    for name, fn in benchmarks().items():
+        if names and not any(sel in name for sel in names):
+            continue
+        results[name] = measure(fn, repeat, warmup, min_time)
+
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+def compare(baseline: Dict, current: Dict, threshold: float=0.1) -> List[Dict]:
+    """
+    Compares the median times of two reports.
+
+    Args:
+        baseline: (Dict) The saved report to compare against.
+        current: (Dict) The new report.
+        threshold: (float) The largest tolerated slowdown as a fraction;
+            0.1 flags anything more than 10% slower than the baseline.
+
+    Returns:
+        (List[Dict]) One entry per benchmark present in both reports, with
+            its 'name', 'baseline' and 'current' medians, their 'ratio'
+            (current / baseline) and whether it 'regressed'.
+
+    """
+
+    rows = []
+    for name, base in baseline["results"].items():
+        if name not in current["results"]:
+            continue
+        cur = current["results"][name]["median"]
+        ratio = cur / base["median"] if base["median"] else float("inf")
+        rows.append({
+            "name": name,
+            "baseline": base["median"],
+            "current": cur,
+            "ratio": ratio,
+            "regressed": ratio > 1 + threshold,
+        })
+    return rows
@@ -0,0 +1,113 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains the command-line entry point, which mimics
+#                  the output and '-c' verification mode of 'sha256sum'.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+import argparse
+import sys
+from typing import List, Optional
+from sha256.core.engines import ENGINES
+from sha256.file import hash_file
+
+PROG = "sha256"
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=f"python -m {PROG}",
+        description="Print or check SHA-256 checksums. With no FILE, or when FILE is -, read standard input.",
+    )
+    parser.add_argument("files", nargs="*", metavar="FILE", default=["-"])
+    parser.add_argument("-c", "--check", action="store_true",
+                        help="read checksums from the FILEs and check them")
+    parser.add_argument("--quiet", action="store_true",
+                        help="don't print OK for each successfully verified file")
+    parser.add_argument("--status", action="store_true",
+                        help="don't output anything, status code shows success")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit non-zero for improperly formatted checksum lines")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="uint32",
+                        help="word engine to hash with (default: uint32)")
+    return parser
+
+def _check(listing: str, args: argparse.Namespace) -> int:
+    # verifies every '<digest>  <name>' line of a checksum listing
+    engine = ENGINES[args.engine]
+    failed = unreadable = malformed = formatted = 0
+
+    stream = sys.stdin if listing == "-" else open(listing)
+    with stream:
+        for line in stream:
+            # listings written on Windows end their lines in '\r\n'
+            line = line.rstrip("\r\n")
+            digest, sep, name = line.partition(" ")
+            if not sep or len(digest) != 64 or name[:1] not in (" ", "*"):
+                malformed += 1
+                continue
+            formatted += 1
+            name = name[1:]
+
+            try:
+                ok = hash_file(name, engine) == digest.lower()
+            except OSError as e:
+                if not args.status:
+                    print(f"{PROG}: {name}: {e.strerror}", file=sys.stderr)
+                    print(f"{name}: FAILED open or read")
+                unreadable += 1
+                continue
+
+            if not ok:
+                failed += 1
+            if args.status or (ok and args.quiet):
+                continue
+            print(f"{name}: {'OK' if ok else 'FAILED'}")
+
+    if not formatted:
+        # like sha256sum, reported even with --status
+        name = "standard input" if listing == "-" else listing
+        print(f"{PROG}: {name}: no properly formatted checksum lines found", file=sys.stderr)
+        return 1
+
+    if not args.status:
+        if malformed:
+            print(f"{PROG}: WARNING: {malformed} line{'s are' if malformed > 1 else ' is'} improperly formatted", file=sys.stderr)
+        if unreadable:
+            print(f"{PROG}: WARNING: {unreadable} listed file{'s' if unreadable > 1 else ''} could not be read", file=sys.stderr)
+        if failed:
+            print(f"{PROG}: WARNING: {failed} computed checksum{'s' if failed > 1 else ''} did NOT match", file=sys.stderr)
+
+    # improperly formatted lines are only warned about, unless --strict
+    return 1 if failed or unreadable or (malformed and args.strict) else 0
+
+def main(argv: Optional[List[str]]=None) -> int:
+    """
+    Runs the command-line interface.
+
+    Args:
+        argv: (List[str]) The arguments to parse; defaults to sys.argv[1:].
+
+    Returns:
+        (int) The exit status (0 on success, 1 on any failure).
+
+    """
+
+    args = _parser().parse_args(argv)
+
+    status = 0
+    for path in args.files:
+        try:
+            if args.check:
+                status |= _check(path, args)
+            else:
+                print(f"{hash_file(path, ENGINES[args.engine])}  {path}")
+        except OSError as e:
+            print(f"{PROG}: {path}: {e.strerror}", file=sys.stderr)
+            status = 1
+
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains hash_many and other auxiliary methods that
+#                  deal with hashing many messages across processes.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional
+from sha256.core.engines import Engine, UINT32
+from sha256.core import bitslice, lanes
+from sha256.sha256 import SHA256, Data, blocks
+
+def _batches(iterable: Iterable[Data], size: int) -> Iterator[List[Data]]:
+    # groups the inputs into lists of 'size'; memoryviews cannot be pickled,
+    # so they are copied into bytes
+    it = iter(iterable)
+    while True:
+        batch = [bytes(data) if isinstance(data, memoryview) else data for data in islice(it, size)]
+        if not batch:
+            return
+        yield batch
+
+def _hash_batch(batch: List[Data], engine: Engine) -> List[str]:
+    # runs in a worker process
+    return [SHA256(data, engine) for data in batch]
+
+def hash_many(iterable: Iterable[Data], workers: Optional[int]=None, chunksize: int=256,
+              engine: Engine=UINT32) -> Iterator[str]:
+    """
+    Computes the hashes of many messages, spread over a pool of worker
+    processes. Inputs are sent to the workers in batches of 'chunksize' so
+    that pickling overhead is amortized over many small messages. Only a
+    bounded number of batches is in flight at once, so the input may be an
+    arbitrarily long (or lazy) iterable; results are streamed back in input
+    order as they complete.
+
+    Example:
+        >>> list(hash_many([b"abc", b""], workers=2))
+        ['ba7816bf...', 'e3b0c442...']
+
+    Args:
+        iterable: (Iterable[Data]) The messages to hash.
+        workers: (int) The number of worker processes. Defaults to the
+            number of CPUs; 1 hashes in the calling process.
+        chunksize: (int) The number of messages sent to a worker at once.
+        engine: (Engine) The word engine to run on.
+
+    Returns:
+        (Iterator[str]) The hexadecimal digests, in input order.
+
+    Raises:
+        (ValueError) Raised if 'chunksize' is less than 1.
+
+    """
+
+    # validated here, so the error is raised by the call itself rather than
+    # on the first next() of the generator
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    return _hash_many(iterable, workers or os.cpu_count() or 1, chunksize, engine)
+
+def _hash_many(iterable: Iterable[Data], workers: int, chunksize: int, engine: Engine) -> Iterator[str]:
+    # the generator behind hash_many
+    if workers == 1:
+        for data in iterable:
+            yield SHA256(data, engine)
+        return
+
+    pool = ProcessPoolExecutor(workers)
+    try:
+        # keep every worker busy with one batch queued behind it
+        pending = deque()
+        for batch in _batches(iterable, chunksize):
+            pending.append(pool.submit(_hash_batch, batch, engine))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+def _hash_grouped(iterable: Iterable[Data], hash_padded: Callable, lanes_max: int) -> List[str]:
+    # pads every message, groups them by padded length and hashes each group
+    # (in runs of at most 'lanes_max') with a multi-lane 'hash_padded'
+    groups = {}
+    count = 0
+    for i, data in enumerate(iterable):
+        padded = b"".join(blocks((data,)))
+        groups.setdefault(len(padded), []).append((i, padded))
+        count += 1
+
+    result = [None] * count
+    for group in groups.values():
+        for j in range(0, len(group), lanes_max):
+            chunk = group[j:j+lanes_max]
+            digests = hash_padded([padded for _, padded in chunk])
+            for (i, _), digest in zip(chunk, digests):
+                result[i] = digest
+
+    return result
+
+def hash_lanes(iterable: Iterable[Data], lanes_max: int=4096) -> List[str]:
+    """
+    Computes the hashes of many messages with the NumPy multi-lane engine.
+    Messages are grouped by their padded block count, and each group is
+    hashed in lockstep, up to 'lanes_max' messages at a time. Requires numpy.
+
+    Args:
+        iterable: (Iterable[Data]) The messages to hash.
+        lanes_max: (int) The largest number of messages hashed together.
+
+    Returns:
+        (List[str]) The hexadecimal digests, in input order.
+
+    """
+
+    return _hash_grouped(iterable, lanes.hash_padded, lanes_max)
+
+def hash_bitsliced(iterable: Iterable[Data], lanes_max: int=1024) -> List[str]:
+    """
+    Computes the hashes of many messages with the bitsliced engine. Messages
+    are grouped by their padded block count, and each group is hashed with
+    one lane per message, up to 'lanes_max' messages at a time. The cost of a
+    round barely depends on the number of lanes, so wider groups amortize the
+    interpreter overhead further.
+
+    Args:
+        iterable: (Iterable[Data]) The messages to hash.
+        lanes_max: (int) The largest number of messages hashed together.
+
+    Returns:
+        (List[str]) The hexadecimal digests, in input order.
+
+    """
+
+    return _hash_grouped(iterable, bitslice.hash_padded, lanes_max)
@@ -0,0 +1,133 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains MidstateCache, which caches the compression
+#                  context after common whole-block message prefixes.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+from collections import OrderedDict
+from typing import NamedTuple
+from sha256.core.engines import Engine, UINT32
+from sha256.sha256 import Sha256, Data, _view
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+class MidstateCache:
+    """
+    A bounded, least-recently-used cache of midstates. Each entry maps a
+    whole-block message prefix to the 8-word compression context after it,
+    so messages sharing a prefix (such as a common header) resume from the
+    longest cached block boundary instead of recompressing it from the
+    initial hash values.
+
+    Example:
+        >>> cache = MidstateCache(maxsize=64)
+        >>> cache.hexdigest(header + body_a)
+        >>> cache.hexdigest(header + body_b)  # resumes after 'header'
+        >>> cache.info()
+        CacheInfo(hits=1, misses=1, evictions=0, maxsize=64, currsize=...)
+
+    """
+
+    def __init__(self, maxsize: int=128, depth: int=8, engine: Engine=UINT32) -> None:
+        """
+        Args:
+            maxsize: (int) The largest number of midstates kept.
+            depth: (int) The longest prefix cached, in blocks.
+            engine: (Engine) The word engine to run on.
+
+        Raises:
+            (ValueError) Raised if 'maxsize' or 'depth' is less than 1.
+
+        """
+
+        if maxsize < 1 or depth < 1:
+            raise ValueError("maxsize and depth must be at least 1")
+        self.maxsize = maxsize
+        self.depth = depth
+        self.engine = engine
+        self._entries = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def sha256(self, data: Data) -> Sha256:
+        """
+        Creates a hasher fed with 'data', resuming from the longest cached
+        prefix of it. Midstates for the uncached prefix blocks (up to 'depth'
+        blocks) are added to the cache on the way. Messages shorter than one
+        block bypass the cache and count as neither a hit nor a miss.
+
+        Args:
+            data: (Data) The message.
+
+        Returns:
+            (Sha256) A hasher that has consumed 'data'.
+
+        """
+
+        view = _view(data)
+        # only blocks lying entirely inside the message can be shared; the
+        # padded final block depends on the length
+        blocks = min(self.depth, len(view) // 64)
+
+        entries = self._entries
+        h = None
+        for k in range(blocks, 0, -1):
+            key = bytes(view[:64*k])
+            ctx = entries.get(key)
+            if ctx is not None:
+                entries.move_to_end(key)
+                h = Sha256.frommidstate(ctx, 64*k, self.engine)
+                self.hits += 1
+                break
+        else:
+            h = Sha256(engine=self.engine)
+            if blocks:
+                self.misses += 1
+
+        for k in range(h.midstate()[1] // 64 + 1, blocks + 1):
+            h.update(view[64*(k-1):64*k])
+            entries[bytes(view[:64*k])] = h.midstate()[0]
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+        h.update(view[64*blocks:])
+        return h
+
+    def hexdigest(self, data: Data) -> str:
+        """
+        Args:
+            data: (Data) The message.
+
+        Returns:
+            (str) The hexadecimal digest of 'data'.
+
+        """
+
+        return self.sha256(data).hexdigest()
+
+    def info(self) -> CacheInfo:
+        """
+        Returns:
+            (CacheInfo) The hit, miss and eviction counts and the size of
+                the cache.
+
+        """
+
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """
+        Empties the cache and resets its statistics.
+
+        """
+
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
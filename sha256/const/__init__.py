@@ -6,6 +6,9 @@
 # LICENSE: MIT
 # ============================================================================ #
 
+from functools import lru_cache
+from typing import Tuple
+
 # initial hash values; computed from the fractional part of the square root of the first 8 primes (2 -> 19)
 H = (0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19) 
 
@@ -18,3 +21,63 @@ K = (0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x9
      0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
      0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
      0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2)
+
+# the number of distinct (word type, value) pairs memoized by 'cached_word'
+WORD_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=None)
+def k_words(word: type) -> Tuple:
+    """
+    The hash constants (K) as instances of a word type, built the first time
+    they are requested and shared by every caller afterwards.
+
+    The words are shared, so they are frozen (see the word type's freeze):
+    in-place operations on them raise. Call copy() on a word to get a
+    mutable one.
+
+    Args:
+        word: (type) The word type, such as UInt32 or UBitArray32.
+
+    Returns:
+        (Tuple) The 64 constant words.
+
+    """
+
+    return tuple(word.fromint(k).freeze() for k in K)
+
+@lru_cache(maxsize=None)
+def h_words(word: type) -> Tuple:
+    """
+    The initial hash values (H) as instances of a word type, built the first
+    time they are requested and shared by every caller afterwards. See
+    k_words.
+
+    Args:
+        word: (type) The word type, such as UInt32 or UBitArray32.
+
+    Returns:
+        (Tuple) The 8 initial state words.
+
+    """
+
+    return tuple(word.fromint(h).freeze() for h in H)
+
+@lru_cache(maxsize=WORD_CACHE_SIZE)
+def cached_word(word: type, n: int):
+    """
+    A memoized, bounded 'word.fromint'. Values that keep recurring, such as
+    the zero and 0x80000000 words of padding blocks and the length words of
+    equally sized messages, are only ever converted once; the least recently
+    used values are evicted beyond WORD_CACHE_SIZE. The words are frozen,
+    as for k_words.
+
+    Args:
+        word: (type) The word type, such as UInt32 or UBitArray32.
+        n: (int) The integer to create the word from.
+
+    Returns:
+        (word) The shared, frozen word.
+
+    """
+
+    return word.fromint(n).freeze()
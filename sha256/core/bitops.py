@@ -94,6 +94,44 @@ def add(a: List[int], b: List[int]) -> List[int]:
 
     return result[::-1]
 
+def add_many(*operands: List[int]) -> List[int]:
+    """
+    Adds any number of equal-length lists of bits together, truncating the
+    sum to the length of the operands. Rather than rippling a carry through
+    every intermediate sum, operands are folded three at a time into a
+    partial sum and a carry word (carry-save addition) and the carry is
+    only propagated once, after a single pair of words is left.
+
+    The bits of each operand are packed one per byte into a single integer,
+    so each carry-save step is a handful of bitwise operations over the
+    whole word and a shift by one position is a shift by one byte.
+
+    Args:
+        *operands: (List[int]) The addends, all of the same length.
+
+    Returns:
+        (List[int]) The sum of the addends, modulo 2**len(operands[0]).
+
+    """
+
+    n = len(operands[0])
+    mask = (1 << 8*n) - 1
+    words = [int.from_bytes(bytes(bits), "big") for bits in operands]
+
+    # 3:2 compression: x+y+z == (x^y^z) + (maj(x,y,z) << 1)
+    while len(words) > 2:
+        x, y, z = words.pop(), words.pop(), words.pop()
+        words.append(x ^ y ^ z)
+        words.append((((x & y) | (x & z) | (y & z)) << 8) & mask)
+
+    total = words[0]
+    carry = words[1] if len(words) > 1 else 0
+    # final carry propagation
+    while carry:
+        total, carry = total ^ carry, ((total & carry) << 8) & mask
+
+    return list(total.to_bytes(n, "big"))
+
 def twos(bits: List[int]) -> List[int]:
     """
     Converts a list of bits into its Two's Complement representation. The bits
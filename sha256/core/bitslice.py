@@ -0,0 +1,313 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains the bitsliced engine, which hashes many
+#                  messages at once. A word is a list of 32 bit slices (most
+#                  significant first, like UBitArray32), and each slice is a
+#                  Python integer whose 'j'th bit belongs to lane 'j'.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+from typing import List
+from sha256.const import H, K
+
+# a bitsliced word; 32 integers, one per bit position
+Slices = List[int]
+
+def constant(n: int, mask: int) -> Slices:
+    """
+    Broadcasts an integer to every lane.
+
+    Args:
+        n: (int) The 32-bit value.
+        mask: (int) A slice with every lane set, (2**lanes)-1.
+
+    Returns:
+        (Slices) The bitsliced word.
+
+    """
+
+    return [mask if (n >> i) & 1 else 0 for i in range(31, -1, -1)]
+
+def rotr(x: Slices, n: int) -> Slices:
+    """
+    Rotates every lane rightwards by 'n' positions; a plain reindexing of the
+    slices, exactly like UBitArray32.rotr.
+
+    Args:
+        x: (Slices) The word to rotate.
+        n: (int) The amount to rotate by.
+
+    Returns:
+        (Slices) The rotated word.
+
+    """
+
+    n %= 32
+    return x[-n:] + x[:-n]
+
+def rshift(x: Slices, n: int) -> Slices:
+    """
+    Shifts every lane rightwards by 'n' positions.
+
+    Args:
+        x: (Slices) The word to shift.
+        n: (int) The amount to shift by.
+
+    Returns:
+        (Slices) The shifted word.
+
+    """
+
+    if n == 0:
+        return list(x)
+    elif n >= 32:
+        return [0]*32
+    return [0]*n + x[:-n]
+
+def xor(x: Slices, y: Slices, z: Slices) -> Slices:
+    """
+    Computes the bitwise XOR of three words in every lane.
+
+    Args:
+        x: (Slices)
+        y: (Slices)
+        z: (Slices)
+
+    Returns:
+        (Slices) The result of the XOR operation.
+
+    """
+
+    return [p ^ q ^ r for p, q, r in zip(x, y, z)]
+
+def ch(x: Slices, y: Slices, z: Slices) -> Slices:
+    """
+    Takes the 'choice' of 'y' and 'z' based off of 'x' in every lane.
+
+    Args:
+        x: (Slices) The model word.
+        y: (Slices) The bits chosen if the model bit is 1.
+        z: (Slices) The bits chosen if the model bit is 0.
+
+    Returns:
+        (Slices) The result of the choice operation.
+
+    """
+
+    return [(p & q) ^ (r & ~p) for p, q, r in zip(x, y, z)]
+
+def maj(x: Slices, y: Slices, z: Slices) -> Slices:
+    """
+    Takes the 'majority' of three words in every lane.
+
+    Args:
+        x: (Slices)
+        y: (Slices)
+        z: (Slices)
+
+    Returns:
+        (Slices) The result of the majority operation.
+
+    """
+
+    return [(p & q) ^ (p & r) ^ (q & r) for p, q, r in zip(x, y, z)]
+
+def add(x: Slices, y: Slices) -> Slices:
+    """
+    Adds two words (modulo 2**32) in every lane with a ripple-carry over the
+    slices, from the least significant slice up, like bitops.add.
+
+    Args:
+        x: (Slices) The first addend.
+        y: (Slices) The second addend.
+
+    Returns:
+        (Slices) The sum.
+
+    """
+
+    result = [0]*32
+    carry = 0
+    for i in range(31, -1, -1):
+        p, q = x[i], y[i]
+        t = p ^ q
+        result[i] = t ^ carry
+        carry = (p & q) | (carry & t)
+    return result
+
+def lsig0(x: Slices) -> Slices:
+    """
+    (lowercase sigma 0)
+
+    Computes rotr(7) ^ rotr(18) ^ rshift(3) in every lane.
+
+    Args:
+        x: (Slices) The word to operate on.
+
+    Returns:
+        (Slices) The resulting word.
+
+    """
+
+    return xor(rotr(x, 7), rotr(x, 18), rshift(x, 3))
+
+def lsig1(x: Slices) -> Slices:
+    """
+    (lowercase sigma 1)
+
+    Computes rotr(17) ^ rotr(19) ^ rshift(10) in every lane.
+
+    Args:
+        x: (Slices) The word to operate on.
+
+    Returns:
+        (Slices) The resulting word.
+
+    """
+
+    return xor(rotr(x, 17), rotr(x, 19), rshift(x, 10))
+
+def usig0(x: Slices) -> Slices:
+    """
+    (uppercase sigma 0)
+
+    Computes rotr(2) ^ rotr(13) ^ rotr(22) in every lane.
+
+    Args:
+        x: (Slices) The word to operate on.
+
+    Returns:
+        (Slices) The resulting word.
+
+    """
+
+    return xor(rotr(x, 2), rotr(x, 13), rotr(x, 22))
+
+def usig1(x: Slices) -> Slices:
+    """
+    (uppercase sigma 1)
+
+    Computes rotr(6) ^ rotr(11) ^ rotr(25) in every lane.
+
+    Args:
+        x: (Slices) The word to operate on.
+
+    Returns:
+        (Slices) The resulting word.
+
+    """
+
+    return xor(rotr(x, 6), rotr(x, 11), rotr(x, 25))
+
+def pack(blocks: List[bytes]) -> List[Slices]:
+    """
+    Transposes one 64-byte block per lane into 16 bitsliced words.
+
+    Args:
+        blocks: (List[bytes]) The blocks; lane 'j' takes blocks[j].
+
+    Returns:
+        (List[Slices]) The 16 bitsliced words.
+
+    """
+
+    # one 512-character bit string per lane, highest lane first; zip then
+    # transposes them into one column (bit position) at a time
+    rows = [format(int.from_bytes(block, "big"), "0512b") for block in reversed(blocks)]
+    slices = [int("".join(col), 2) for col in zip(*rows)]
+    return [slices[i:i+32] for i in range(0, 512, 32)]
+
+def unpack(wds: List[Slices], lanes: int) -> List[str]:
+    """
+    Transposes bitsliced words back into one hexadecimal string per lane.
+
+    Args:
+        wds: (List[Slices]) The words to transpose.
+        lanes: (int) The number of lanes.
+
+    Returns:
+        (List[str]) The hexadecimal string of each lane, in lane order.
+
+    """
+
+    # one column per bit position, lowest lane first
+    cols = [format(s, f"0{lanes}b")[::-1] for wd in wds for s in wd]
+    width = len(cols) // 4
+    return [format(int("".join(row), 2), f"0{width}x") for row in zip(*cols)]
+
+def schedule_lanes(wds: List[Slices]) -> List[Slices]:
+    """
+    Expands 16 bitsliced words into a 64-word message schedule. See
+    sha256.sha256.schedule.
+
+    Args:
+        wds: (List[Slices]) The original 16 words; extended in place.
+
+    Returns:
+        (List[Slices]) The final 64 words (message schedule).
+
+    """
+
+    for i in range(len(wds), 64):
+        w = add(add(lsig1(wds[i-2]), wds[i-7]), add(lsig0(wds[i-15]), wds[i-16]))
+        wds.append(w)
+    return wds
+
+def compress_lanes(wds: List[Slices], ctx: List[Slices], mask: int) -> List[Slices]:
+    """
+    Compresses bitsliced message schedules into the state registers. See
+    sha256.sha256.compress.
+
+    Args:
+        wds: (List[Slices]) The 64 words of the message schedule.
+        ctx: (List[Slices]) The context of a previous compression, or None
+            to use the initial hash values.
+        mask: (int) A slice with every lane set, (2**lanes)-1.
+
+    Returns:
+        (List[Slices]) The resulting context of the state registers.
+
+    """
+
+    state = ctx or [constant(n, mask) for n in H]
+    a,b,c,d,e,f,g,h = state
+
+    for i in range(64):
+        t1 = add(add(add(usig1(e), ch(e,f,g)), add(h, constant(K[i], mask))), wds[i])
+        t2 = add(usig0(a), maj(a,b,c))
+        h = g
+        g = f
+        f = e
+        e = add(d, t1)
+        d = c
+        c = b
+        b = a
+        a = add(t1, t2)
+
+    return [add(x, y) for x, y in zip((a,b,c,d,e,f,g,h), state)]
+
+def hash_padded(padded: List[bytes]) -> List[str]:
+    """
+    Hashes messages that are already padded to the same number of blocks,
+    one message per lane.
+
+    Args:
+        padded: (List[bytes]) The padded messages; all of equal length, a
+            multiple of 64 bytes.
+
+    Returns:
+        (List[str]) The hexadecimal digests, in order.
+
+    """
+
+    lanes = len(padded)
+    mask = (1 << lanes) - 1
+
+    ctx = None
+    for i in range(0, len(padded[0]), 64):
+        wds = pack([msg[i:i+64] for msg in padded])
+        ctx = compress_lanes(schedule_lanes(wds), ctx, mask)
+
+    return unpack(ctx, lanes)
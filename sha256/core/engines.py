@@ -0,0 +1,88 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains the word engines that the hash function can
+#                  run on. An engine bundles a word type with the bit
+#                  functions that operate on it.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+from typing import Callable, NamedTuple
+from sha256.core import ubitarray_32, uint_32
+
+class Engine(NamedTuple):
+    """
+    A word type together with the functions SHA-256 needs to operate on it.
+    Every function takes and returns instances of 'word'; the '_into'
+    variants take a word to overwrite as their first argument and return it.
+
+    """
+
+    name: str
+    word: type
+    ch: Callable
+    maj: Callable
+    lsig0: Callable
+    lsig1: Callable
+    usig0: Callable
+    usig1: Callable
+    ch_into: Callable
+    maj_into: Callable
+    usig0_into: Callable
+    usig1_into: Callable
+
+# reference engine; a list of 32 bits per word
+UBITARRAY32 = Engine(
+    "ubitarray32",
+    ubitarray_32.UBitArray32,
+    ubitarray_32.ch,
+    ubitarray_32.maj,
+    ubitarray_32.lsig0,
+    ubitarray_32.lsig1,
+    ubitarray_32.usig0,
+    ubitarray_32.usig1,
+    ubitarray_32.ch_into,
+    ubitarray_32.maj_into,
+    ubitarray_32.usig0_into,
+    ubitarray_32.usig1_into,
+)
+
+# integer engine; a single masked integer per word
+UINT32 = Engine(
+    "uint32",
+    uint_32.UInt32,
+    uint_32.ch,
+    uint_32.maj,
+    uint_32.lsig0,
+    uint_32.lsig1,
+    uint_32.usig0,
+    uint_32.usig1,
+    uint_32.ch_into,
+    uint_32.maj_into,
+    uint_32.usig0_into,
+    uint_32.usig1_into,
+)
+
+ENGINES = {engine.name: engine for engine in (UBITARRAY32, UINT32)}
+
+def engine_of(word) -> Engine:
+    """
+    Finds the engine a word belongs to, for callers that pass bare words
+    without naming an engine.
+
+    Args:
+        word: (object) An instance of an engine's word type.
+
+    Returns:
+        (Engine) The engine whose word type 'word' is an instance of.
+
+    Raises:
+        (TypeError) Raised if no engine operates on words of that type.
+
+    """
+
+    for engine in ENGINES.values():
+        if isinstance(word, engine.word):
+            return engine
+    raise TypeError(f"no engine operates on {type(word).__name__} words")
@@ -0,0 +1,111 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains the optional NumPy multi-lane engine, which
+#                  runs the message schedule and compression of many messages
+#                  in lockstep. Word 'i' of every lane lives in one uint32
+#                  array, so each round is a few vectorized operations.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+from typing import List
+from sha256.const import H, K
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("the NumPy multi-lane engine requires numpy")
+
+def _rotr(x, n: int):
+    return (x >> np.uint32(n)) | (x << np.uint32(32-n))
+
+def schedule_lanes(wds) -> "np.ndarray":
+    """
+    Expands the first 16 words of N blocks into their 64-word message
+    schedules. See sha256.sha256.schedule.
+
+    Args:
+        wds: (np.ndarray) A (16, N) uint32 array; column 'j' holds the words
+            of lane 'j'.
+
+    Returns:
+        (np.ndarray) A (64, N) uint32 array of message schedules.
+
+    """
+
+    _require_numpy()
+    w = np.empty((64, wds.shape[1]), dtype=np.uint32)
+    w[:16] = wds
+    for i in range(16, 64):
+        x, y = w[i-15], w[i-2]
+        s0 = _rotr(x, 7) ^ _rotr(x, 18) ^ (x >> np.uint32(3))
+        s1 = _rotr(y, 17) ^ _rotr(y, 19) ^ (y >> np.uint32(10))
+        w[i] = s1 + w[i-7] + s0 + w[i-16]
+    return w
+
+def compress_lanes(w, ctx=None) -> "np.ndarray":
+    """
+    Compresses N message schedules into their state registers. See
+    sha256.sha256.compress.
+
+    Args:
+        w: (np.ndarray) A (64, N) uint32 array of message schedules.
+        ctx: (np.ndarray) An (8, N) uint32 array holding the context of a
+            previous compression. If not supplied, the initial hash values
+            are used.
+
+    Returns:
+        (np.ndarray) The resulting (8, N) context of the state registers.
+
+    """
+
+    _require_numpy()
+    if ctx is None:
+        ctx = np.repeat(np.array(H, dtype=np.uint32)[:, None], w.shape[1], axis=1)
+    a,b,c,d,e,f,g,h = ctx
+    k = np.array(K, dtype=np.uint32)
+
+    for i in range(64):
+        t1 = (_rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)) + ((e & f) ^ (~e & g)) + h + k[i] + w[i]
+        t2 = (_rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c))
+        h = g
+        g = f
+        f = e
+        e = d + t1
+        d = c
+        c = b
+        b = a
+        a = t1 + t2
+
+    return ctx + np.stack((a,b,c,d,e,f,g,h))
+
+def hash_padded(padded: List[bytes]) -> List[str]:
+    """
+    Hashes messages that are already padded to the same number of blocks.
+
+    Args:
+        padded: (List[bytes]) The padded messages; all of equal length, a
+            multiple of 64 bytes.
+
+    Returns:
+        (List[str]) The hexadecimal digests, in order.
+
+    """
+
+    _require_numpy()
+    nblocks = len(padded[0]) // 64
+    # (N, blocks, 16) big-endian words -> (blocks, 16, N) lanes
+    wds = np.frombuffer(b"".join(padded), dtype=">u4").astype(np.uint32)
+    wds = wds.reshape(len(padded), nblocks, 16).transpose(1, 2, 0)
+
+    ctx = None
+    for block in wds:
+        ctx = compress_lanes(schedule_lanes(block), ctx)
+
+    digests = ctx.T.astype(">u4").tobytes()
+    return [digests[i:i+32].hex() for i in range(0, len(digests), 32)]
@@ -11,7 +11,7 @@ from __future__ import annotations
 from typing import List, Union
 from collections.abc import Iterator
 from functools import reduce
-from sha256.core.bitops import binary, prepad, twos, add
+from sha256.core.bitops import binary, prepad, twos, add, add_many
 from sha256.const.tables import HEX
 
 class UBitArray32:
@@ -23,7 +23,13 @@ class UBitArray32:
     that this array should hold is (2**32)-1, or 4294967295. Negative numbers
     will also be converted into their unsigned counterpart.
 
+    The bits are stored compactly in a bytearray (one byte per bit) and the
+    class uses __slots__, so an instance carries no per-instance __dict__.
+    Indexing, slicing and iteration still yield plain 0/1 integers.
+
     """
+
+    __slots__ = ("_bits",)
     
     def __init__(self, bits: List[int]) -> None:
         """
@@ -33,6 +39,34 @@ class UBitArray32:
 
         """
 
+        self.bits = bits
+
+    @property
+    def bits(self) -> List[int]:
+        """
+        The bits, most significant first. Reading returns a copy, so changing
+        a single bit takes assigning the whole list back, for example:
+            bits = a.bits
+            bits[0] = 1
+            a.bits = bits
+
+        Returns:
+            (List[int]) A copy of the bits as a list.
+
+        """
+
+        return list(self._bits)
+
+    @bits.setter
+    def bits(self, bits: List[int]) -> None:
+        """
+        Replaces the bits, truncated or zero-padded to 32 as in __init__.
+
+        Args:
+            bits: (List[int]) The new bits.
+
+        """
+
         if not bits:
             raise ValueError(f"cannot create empty {self.__class__.__name__}")
         elif len(bits) > 32:
@@ -40,9 +74,17 @@ class UBitArray32:
             bits = bits[-32:]
         elif len(bits) < 32:
             # pad with zeros to 32 bits
-            bits = [0]*(32-len(bits)) + bits
-        
-        self.bits = bits
+            bits = bytes(32-len(bits)) + bytes(bits)
+
+        self._bits = bytearray(bits)
+
+    @classmethod
+    def _wrap(cls, bits: bytearray) -> UBitArray32:
+        # creates an instance around exactly 32 bits, skipping the checks in
+        # __init__; only for internal use
+        obj = cls.__new__(cls)
+        obj._bits = bits
+        return obj
 
     @classmethod
     def fromint(cls, n: int) -> UBitArray32:
@@ -125,11 +167,11 @@ class UBitArray32:
         """
 
         if n >= len(self):
-            return self.__class__([0]*len(self))
+            return self._wrap(bytearray(len(self)))
         else:
             # chop last n bits, prepend n '0's
-            result = [0]*n + self.bits[:-n]
-            return self.__class__(result)
+            result = bytearray(n) + self._bits[:-n]
+            return self._wrap(result)
     
     def rotr(self, n: int) -> UBitArray32:
         """
@@ -146,8 +188,8 @@ class UBitArray32:
 
         n %= len(self)
         # chop last n bits, prepend them
-        result = self.bits[-n:] + self.bits[:-n]
-        return self.__class__(result)
+        result = self._bits[-n:] + self._bits[:-n]
+        return self._wrap(result)
 
     def __xor__(self, other: UBitArray32) -> UBitArray32:
         """
@@ -162,11 +204,8 @@ class UBitArray32:
 
         """
 
-        result = []
-        for x,y in zip(self.bits, other.bits):
-            result.append((x + y) % 2)
-
-        return self.__class__(result)
+        result = bytearray(x ^ y for x,y in zip(self._bits, other._bits))
+        return self._wrap(result)
 
     def __add__(self, other: UBitArray32) -> UBitArray32:
         """
@@ -181,7 +220,130 @@ class UBitArray32:
 
         """
 
-        return self.__class__(add(self, other))
+        return self._wrap(bytearray(add(self._bits, other._bits)[-32:]))
+
+    @classmethod
+    def add_many(cls, *bitarrays: UBitArray32) -> UBitArray32:
+        """
+        Computes the sum (modulo 2**32) of any number of instances of
+        UBitArray32 with a single carry propagation. See
+        sha256.core.bitops.add_many.
+
+        Args:
+            *bitarrays: (UBitArray32) The instances to add together.
+
+        Returns:
+            (UBitArray32) The resulting UBitArray32 object.
+
+        """
+
+        return cls._wrap(bytearray(add_many(*(x._bits for x in bitarrays))))
+
+    def __iadd__(self, other: UBitArray32) -> UBitArray32:
+        """
+        Adds another instance of UBitArray32 to this one in place.
+
+        Args:
+            other: (UBitArray32) The other instance to add.
+
+        Returns:
+            (UBitArray32) This (mutated) object.
+
+        """
+
+        bits, y = self._bits, other._bits
+        carry = 0
+        for i in range(31, -1, -1):
+            total = bits[i] + y[i] + carry
+            bits[i] = total & 1
+            carry = total >> 1
+        return self
+
+    def __ixor__(self, other: UBitArray32) -> UBitArray32:
+        """
+        Computes the bitwise XOR with another instance of UBitArray32 in
+        place.
+
+        Args:
+            other: (UBitArray32) The other instance to compute XOR with.
+
+        Returns:
+            (UBitArray32) This (mutated) object.
+
+        """
+
+        bits, others = self._bits, other._bits
+        for i in range(32):
+            bits[i] ^= others[i]
+        return self
+
+    def add_into(self, a: UBitArray32, b: UBitArray32, *rest: UBitArray32) -> UBitArray32:
+        """
+        Overwrites this object with the sum (modulo 2**32) of the addends.
+        Two addends are added by rippling the carry from the rightmost bit
+        leftwards and writing each bit straight into this object's storage;
+        more are carry-saved as in add_many. Any addend may be this object
+        itself, since every position is read before it is written.
+
+        Args:
+            a: (UBitArray32) The first addend.
+            b: (UBitArray32) The second addend.
+            *rest: (UBitArray32) Any further addends.
+
+        Returns:
+            (UBitArray32) This (mutated) object.
+
+        """
+
+        if rest:
+            self._bits[:] = add_many(a._bits, b._bits, *(x._bits for x in rest))
+            return self
+
+        x, y = a._bits, b._bits
+        bits = self._bits
+        carry = 0
+        for i in range(31, -1, -1):
+            total = x[i] + y[i] + carry
+            bits[i] = total & 1
+            carry = total >> 1
+        return self
+
+    def rotr_into(self, src: UBitArray32, n: int) -> UBitArray32:
+        """
+        Overwrites this object with the bits of 'src' rotated 'n' positions
+        rightwards.
+
+        Args:
+            src: (UBitArray32) The bits to rotate.
+            n: (int) The amount to rotate by.
+
+        Returns:
+            (UBitArray32) This (mutated) object.
+
+        """
+
+        n %= 32
+        bits = src._bits
+        self._bits[:] = bits[-n:] + bits[:-n]
+        return self
+
+    def copy(self) -> UBitArray32:
+        """
+        Returns:
+            (UBitArray32) An independent copy, safe to mutate in place.
+
+        """
+
+        return self._wrap(bytearray(self._bits))
+
+    def freeze(self) -> FrozenUBitArray32:
+        """
+        Returns:
+            (FrozenUBitArray32) An immutable copy, safe to share.
+
+        """
+
+        return FrozenUBitArray32._wrap(self._bits)
 
     def __eq__(self, other: UBitArray32) -> bool:
         """
@@ -197,7 +359,7 @@ class UBitArray32:
 
         """
 
-        return self.bits == other.bits
+        return self._bits == other._bits
 
     def __getitem__(self, i) -> Union[int, UBitArray32]:
         """
@@ -213,23 +375,23 @@ class UBitArray32:
         """
 
         if isinstance(i, int):
-            return self.bits[i]
+            return self._bits[i]
         elif isinstance(i, slice):
-            if not self.bits[i]:
+            if not self._bits[i]:
                 raise ValueError(f"slice results in empty {self.__class__.__name__}")
-            return self.__class__(self.bits[i])
+            return self.__class__(self._bits[i])
 
     def __iter__(self) -> Iterator[int]:
         """
         Supports iteration over instances of UBitArray32.
 
         Returns:
-            (list_iterator): An iterator of the set of bits contained by the
+            (Iterator[int]): An iterator of the set of bits contained by the
                 instance of UBitArray32.
 
         """
 
-        return iter(self.bits)
+        return iter(self._bits)
 
     def __len__(self) -> int:
         """
@@ -238,7 +400,7 @@ class UBitArray32:
 
         """
 
-        return len(self.bits)
+        return len(self._bits)
 
     def __str__(self) -> str:
         """
@@ -248,7 +410,7 @@ class UBitArray32:
                 
         """
 
-        return "".join([str(bit) for bit in self.bits])
+        return "".join([str(bit) for bit in self._bits])
     
     def __repr__(self) -> str:
         """
@@ -259,11 +421,121 @@ class UBitArray32:
         """
 
         cls_name = self.__class__.__name__
-        bit_repr = " ".join([str(bit) for bit in self.bits])
+        bit_repr = " ".join([str(bit) for bit in self._bits])
         return f"{cls_name}[{bit_repr}]"
 
 
+class FrozenUBitArray32(UBitArray32):
+    """
+    (Frozen Unsigned 32-Bit Array)
+
+    An immutable UBitArray32, for words that are shared between callers,
+    such as the precomputed constant tables. The bits are stored in bytes
+    rather than a bytearray, and every in-place operation raises, so a
+    shared word can never be changed under the hash function. Like
+    frozenset, operations that return a new word return a frozen one; copy()
+    returns a mutable UBitArray32.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, bits: List[int]) -> None:
+        """
+        Args:
+            bits: (List[int]) The list of bits to create a FrozenUBitArray32
+                object from; truncated or zero-padded as in UBitArray32.
+
+        """
 
+        object.__setattr__(self, "_bits", bytes(UBitArray32(bits)._bits))
+
+    @classmethod
+    def _wrap(cls, bits: bytearray) -> FrozenUBitArray32:
+        # creates an instance around an immutable copy of exactly 32 bits
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "_bits", bytes(bits))
+        return obj
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError(f"{self.__class__.__name__} is immutable; copy() it first")
+
+    __setattr__ = __iadd__ = __ixor__ = add_into = rotr_into = _frozen
+
+    def copy(self) -> UBitArray32:
+        """
+        Returns:
+            (UBitArray32) A mutable copy, safe to mutate in place.
+
+        """
+
+        return UBitArray32._wrap(bytearray(self._bits))
+
+    def freeze(self) -> FrozenUBitArray32:
+        """
+        Returns:
+            (FrozenUBitArray32) This object, which is already immutable.
+
+        """
+
+        return self
+
+
+
+
+# the fused sigma kernels below index into the source bits with one trailing
+# zero appended, so position 32 reads as the bit shifted in by rshift
+_ZERO = 32
+
+def _rotr_index(n: int) -> List[int]:
+    # source position of every output bit of rotr(n)
+    return [(i-n) % 32 for i in range(32)]
+
+def _rshift_index(n: int) -> List[int]:
+    # source position of every output bit of rshift(n)
+    return [i-n if i >= n else _ZERO for i in range(32)]
+
+def _sigma_table(*indexes: List[int]) -> List[tuple]:
+    # zips the index maps so that each entry holds the three source positions
+    # that are XORed into one output bit
+    return list(zip(*indexes))
+
+_LSIG0 = _sigma_table(_rotr_index(7), _rotr_index(18), _rshift_index(3))
+_LSIG1 = _sigma_table(_rotr_index(17), _rotr_index(19), _rshift_index(10))
+_USIG0 = _sigma_table(_rotr_index(2), _rotr_index(13), _rotr_index(22))
+_USIG1 = _sigma_table(_rotr_index(6), _rotr_index(11), _rotr_index(25))
+
+def _sigma(bitarray: UBitArray32, table: List[tuple], dst: UBitArray32=None) -> UBitArray32:
+    # computes the three rotations/shifts and their XOR in a single pass over
+    # the source bits, into 'dst' if given, otherwise into a new word
+    src = bitarray._bits + b"\x00"
+    bits = [src[i] ^ src[j] ^ src[k] for i,j,k in table]
+    if dst is None:
+        return UBitArray32._wrap(bytearray(bits))
+    dst._bits[:] = bits
+    return dst
+
+def _truth_table(fn) -> bytes:
+    # the result of a three-input bit function for every packed index
+    # x*4 + y*2 + z, padded to the 256 entries that bytes.translate expects
+    return bytes(fn(i >> 2, (i >> 1) & 1, i & 1) for i in range(8)) + bytes(248)
+
+_CH = _truth_table(lambda x, y, z: y if x else z)
+_MAJ = _truth_table(lambda x, y, z: int(x + y + z >= 2))
+
+def _lookup(a: UBitArray32, b: UBitArray32, c: UBitArray32, table: bytes,
+            dst: UBitArray32=None) -> UBitArray32:
+    # packs the three bits at every position into one byte (a*4 + b*2 + c)
+    # with a single integer expression over the whole word, then looks all
+    # 32 packed bytes up in the truth table at once; no byte can carry into
+    # its neighbour since each holds at most 7. The result goes into 'dst' if
+    # given, otherwise into a new word
+    n = (int.from_bytes(a._bits, "big") << 2) | (int.from_bytes(b._bits, "big") << 1) | int.from_bytes(c._bits, "big")
+    bits = n.to_bytes(32, "big").translate(table)
+    if dst is None:
+        return UBitArray32._wrap(bytearray(bits))
+    dst._bits[:] = bits
+    return dst
 
 def xor(*bitarrays: UBitArray32) -> UBitArray32:
     """
@@ -301,10 +573,7 @@ def ch(a: UBitArray32, b: UBitArray32, c: UBitArray32) -> UBitArray32:
 
     """
 
-    result = []
-    for model, y, z in zip(a, b, c):
-        result.append(y if model else z)
-    return UBitArray32(result)
+    return _lookup(a, b, c, _CH)
 
 def maj(a: UBitArray32, b: UBitArray32, c: UBitArray32) -> UBitArray32:
     """
@@ -328,10 +597,7 @@ def maj(a: UBitArray32, b: UBitArray32, c: UBitArray32) -> UBitArray32:
 
     """
 
-    result = []
-    for bits in zip(a,b,c):
-        result.append(max(bits, key=bits.count))
-    return UBitArray32(result)
+    return _lookup(a, b, c, _MAJ)
 
 def lsig0(bitarray: UBitArray32) -> UBitArray32:
     """
@@ -349,10 +615,7 @@ def lsig0(bitarray: UBitArray32) -> UBitArray32:
 
     """
     
-    a = bitarray.rotr(7)
-    b = bitarray.rotr(18)
-    c = bitarray.rshift(3)
-    return xor(a,b,c)
+    return _sigma(bitarray, _LSIG0)
 
 def lsig1(bitarray: UBitArray32) -> UBitArray32:
     """
@@ -370,10 +633,7 @@ def lsig1(bitarray: UBitArray32) -> UBitArray32:
 
     """
     
-    a = bitarray.rotr(17)
-    b = bitarray.rotr(19)
-    c = bitarray.rshift(10)
-    return xor(a,b,c)
+    return _sigma(bitarray, _LSIG1)
 
 def usig0(bitarray: UBitArray32) -> UBitArray32:
     """
@@ -391,10 +651,7 @@ def usig0(bitarray: UBitArray32) -> UBitArray32:
 
     """
     
-    a = bitarray.rotr(2)
-    b = bitarray.rotr(13)
-    c = bitarray.rotr(22)
-    return xor(a,b,c)
+    return _sigma(bitarray, _USIG0)
 
 def usig1(bitarray: UBitArray32) -> UBitArray32:
     """
@@ -412,7 +669,68 @@ def usig1(bitarray: UBitArray32) -> UBitArray32:
 
     """
     
-    a = bitarray.rotr(6)
-    b = bitarray.rotr(11)
-    c = bitarray.rotr(25)
-    return xor(a,b,c)
+    return _sigma(bitarray, _USIG1)
+
+def ch_into(dst: UBitArray32, a: UBitArray32, b: UBitArray32, c: UBitArray32) -> UBitArray32:
+    """
+    Writes ch(a, b, c) into the bits of 'dst' instead of a new word.
+
+    Args:
+        dst: (UBitArray32) The word to overwrite.
+        a: (UBitArray32) The model set of bits.
+        b: (UBitArray32) The bits chosen if the model bit is 1.
+        c: (UBitArray32) The bits chosen if the model bit is 0.
+
+    Returns:
+        (UBitArray32) 'dst'.
+
+    """
+
+    return _lookup(a, b, c, _CH, dst)
+
+def maj_into(dst: UBitArray32, a: UBitArray32, b: UBitArray32, c: UBitArray32) -> UBitArray32:
+    """
+    Writes maj(a, b, c) into the bits of 'dst' instead of a new word.
+
+    Args:
+        dst: (UBitArray32) The word to overwrite.
+        a: (UBitArray32)
+        b: (UBitArray32)
+        c: (UBitArray32)
+
+    Returns:
+        (UBitArray32) 'dst'.
+
+    """
+
+    return _lookup(a, b, c, _MAJ, dst)
+
+def usig0_into(dst: UBitArray32, bitarray: UBitArray32) -> UBitArray32:
+    """
+    Writes usig0(bitarray) into the bits of 'dst' instead of a new word.
+
+    Args:
+        dst: (UBitArray32) The word to overwrite.
+        bitarray: (UBitArray32) The set of bits to operate on.
+
+    Returns:
+        (UBitArray32) 'dst'.
+
+    """
+
+    return _sigma(bitarray, _USIG0, dst)
+
+def usig1_into(dst: UBitArray32, bitarray: UBitArray32) -> UBitArray32:
+    """
+    Writes usig1(bitarray) into the bits of 'dst' instead of a new word.
+
+    Args:
+        dst: (UBitArray32) The word to overwrite.
+        bitarray: (UBitArray32) The set of bits to operate on.
+
+    Returns:
+        (UBitArray32) 'dst'.
+
+    """
+
+    return _sigma(bitarray, _USIG1, dst)
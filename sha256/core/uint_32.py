@@ -0,0 +1,649 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains UInt32, an integer-backed counterpart to
+#                  UBitArray32, and the auxiliary methods that operate on it.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+from __future__ import annotations
+from functools import reduce
+from typing import List, Tuple
+from sha256.const import K
+from sha256.const.tables import HEX
+
+MASK = 0xffffffff
+
+class UInt32:
+    """
+    (Unsigned 32-Bit Integer)
+
+    A drop-in alternative to UBitArray32 that stores the word as a single
+    masked Python integer instead of a list of 32 bits. It exposes the same
+    interface (fromint, toint, tohex, rotr, rshift, +, ^), but every operation
+    is a handful of integer instructions rather than a loop over bits.
+    UBitArray32 remains the reference implementation.
+
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int) -> None:
+        """
+        Args:
+            value: (int) The integer to store. Only the lowest 32 bits are
+                kept, so negative numbers are stored as their unsigned
+                counterpart.
+
+        """
+
+        self.value = value & MASK
+
+    @classmethod
+    def fromint(cls, n: int) -> UInt32:
+        """
+        Creates a UInt32 object from an integer.
+
+        Args:
+            n: (int) The integer to create a UInt32 object from.
+
+        Returns:
+            (UInt32) The resulting UInt32 object.
+
+        Raises:
+            (ValueError) Raised if 'n' is larger than (2**32)-1, mirroring
+                UBitArray32.fromint.
+
+        """
+
+        if n > MASK:
+            raise ValueError(f"maximum value of (2**32)-1, or 4294967295, exceeded")
+        return cls(n)
+
+    def toint(self) -> int:
+        """
+        Returns:
+            (int) The (unsigned) integer representation of the UInt32 object.
+
+        """
+
+        return self.value
+
+    def tohex(self) -> str:
+        """
+        Converts the UInt32 object into its hexadecimal representation, one
+        nibble at a time.
+
+        Returns:
+            (str) The hexadecimal representation of the UInt32 object.
+
+        """
+
+        n = self.value
+        return "".join(HEX[(n >> shift) & 0xf] for shift in range(28, -1, -4))
+
+    def rshift(self, n: int) -> UInt32:
+        """
+        Computes a new UInt32 object resulting from shifting the bits 'n'
+        positions rightwards.
+
+        Args:
+            n: (int) The amount to shift by.
+
+        Returns:
+            (UInt32) The resulting UInt32 object.
+
+        """
+
+        return self.__class__(self.value >> n)
+
+    def rotr(self, n: int) -> UInt32:
+        """
+        Computes a new UInt32 object resulting from rotating the bits 'n'
+        positions rightwards.
+
+        Args:
+            n: (int) The amount to rotate by.
+
+        Returns:
+            (UInt32) The resulting UInt32 object.
+
+        """
+
+        n %= 32
+        x = self.value
+        return self.__class__((x >> n) | (x << (32-n)))
+
+    def __xor__(self, other: UInt32) -> UInt32:
+        """
+        Computes the bitwise XOR operation with another instance of UInt32.
+
+        Args:
+            other: (UInt32) The other instance to compute XOR with.
+
+        Returns:
+            (UInt32) The resulting UInt32 object.
+
+        """
+
+        return self.__class__(self.value ^ other.value)
+
+    def __add__(self, other: UInt32) -> UInt32:
+        """
+        Computes the addition (modulo 2**32) with another instance of UInt32.
+
+        Args:
+            other: (UInt32) The other instance to add to.
+
+        Returns:
+            (UInt32) The resulting UInt32 object.
+
+        """
+
+        return self.__class__(self.value + other.value)
+
+    @classmethod
+    def add_many(cls, *words: UInt32) -> UInt32:
+        """
+        Computes the sum (modulo 2**32) of any number of instances of UInt32,
+        masking only once at the end.
+
+        Args:
+            *words: (UInt32) The instances to add together.
+
+        Returns:
+            (UInt32) The resulting UInt32 object.
+
+        """
+
+        return cls(sum([w.value for w in words]))
+
+    def __iadd__(self, other: UInt32) -> UInt32:
+        """
+        Adds another instance of UInt32 to this one in place.
+
+        Returns:
+            (UInt32) This (mutated) object.
+
+        """
+
+        self.value = (self.value + other.value) & MASK
+        return self
+
+    def __ixor__(self, other: UInt32) -> UInt32:
+        """
+        Computes the bitwise XOR with another instance of UInt32 in place.
+
+        Returns:
+            (UInt32) This (mutated) object.
+
+        """
+
+        self.value ^= other.value
+        return self
+
+    def add_into(self, a: UInt32, b: UInt32, *rest: UInt32) -> UInt32:
+        """
+        Overwrites this object with the sum (modulo 2**32) of the addends,
+        masking only once at the end.
+
+        Returns:
+            (UInt32) This (mutated) object.
+
+        """
+
+        if rest:
+            self.value = (a.value + b.value + sum([w.value for w in rest])) & MASK
+        else:
+            self.value = (a.value + b.value) & MASK
+        return self
+
+    def rotr_into(self, src: UInt32, n: int) -> UInt32:
+        """
+        Overwrites this object with 'src' rotated 'n' positions rightwards.
+
+        Returns:
+            (UInt32) This (mutated) object.
+
+        """
+
+        n %= 32
+        x = src.value
+        self.value = ((x >> n) | (x << (32-n))) & MASK
+        return self
+
+    def copy(self) -> UInt32:
+        """
+        Returns:
+            (UInt32) An independent copy, safe to mutate in place.
+
+        """
+
+        return self.__class__(self.value)
+
+    def freeze(self) -> FrozenUInt32:
+        """
+        Returns:
+            (FrozenUInt32) An immutable copy, safe to share.
+
+        """
+
+        return FrozenUInt32(self.value)
+
+    def __eq__(self, other: UInt32) -> bool:
+        """
+        Args:
+            other: (UInt32) The other instance to compare to.
+
+        Returns:
+            (bool) True if both 'self' and 'other' hold the same value;
+                otherwise False.
+
+        """
+
+        return self.value == other.value
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            (int) The length of bits (always 32).
+
+        """
+
+        return 32
+
+    def __str__(self) -> str:
+        """
+        Returns:
+            (str) A simple string representation, for example:
+                '00011011110000111000001000110000'
+
+        """
+
+        return "".join(str((self.value >> i) & 1) for i in range(31, -1, -1))
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            (str) A string representation for debugging, for example:
+                'UInt32[0x1bc38230]'
+
+        """
+
+        return f"{self.__class__.__name__}[0x{self.tohex()}]"
+
+
+class FrozenUInt32(UInt32):
+    """
+    (Frozen Unsigned 32-Bit Integer)
+
+    An immutable UInt32, for words that are shared between callers, such as
+    the precomputed constant tables. Assigning to 'value' and every in-place
+    operation raise, so a shared word can never be changed under the hash
+    function. Like frozenset, operations that return a new word return a
+    frozen one; copy() returns a mutable UInt32.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, value: int) -> None:
+        """
+        Args:
+            value: (int) The integer to store; see UInt32.
+
+        """
+
+        object.__setattr__(self, "value", value & MASK)
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError(f"{self.__class__.__name__} is immutable; copy() it first")
+
+    __setattr__ = __iadd__ = __ixor__ = add_into = rotr_into = _frozen
+
+    def copy(self) -> UInt32:
+        """
+        Returns:
+            (UInt32) A mutable copy, safe to mutate in place.
+
+        """
+
+        return UInt32(self.value)
+
+    def freeze(self) -> FrozenUInt32:
+        """
+        Returns:
+            (FrozenUInt32) This object, which is already immutable.
+
+        """
+
+        return self
+
+
+
+
+def xor(*words: UInt32) -> UInt32:
+    """
+    Computes the bitwise XOR of the input words.
+
+    Args:
+        *words: (UInt32) The words to XOR.
+
+    Returns:
+        (UInt32) The result of the XOR operation.
+
+    """
+
+    return reduce(UInt32.__xor__, words)
+
+def ch(a: UInt32, b: UInt32, c: UInt32) -> UInt32:
+    """
+    Takes the 'choice' of two words ('b' and 'c') based off of the bits in 'a'.
+    See sha256.core.ubitarray_32.ch.
+
+    Args:
+        a: (UInt32) The model word.
+        b: (UInt32) The bits chosen if the model bit is 1.
+        c: (UInt32) The bits chosen if the model bit is 0.
+
+    Returns:
+        (UInt32) The result of the choice operation.
+
+    """
+
+    x = a.value
+    return UInt32((x & b.value) ^ (~x & c.value))
+
+def maj(a: UInt32, b: UInt32, c: UInt32) -> UInt32:
+    """
+    Takes the 'majority' of three words. See sha256.core.ubitarray_32.maj.
+
+    Args:
+        a: (UInt32)
+        b: (UInt32)
+        c: (UInt32)
+
+    Returns:
+        (UInt32) The result of the majority operation.
+
+    """
+
+    x, y, z = a.value, b.value, c.value
+    return UInt32((x & y) ^ (x & z) ^ (y & z))
+
+def _rotr(x: int, n: int) -> int:
+    # rotate a raw 32-bit integer rightwards by 'n' positions
+    return ((x >> n) | (x << (32-n))) & MASK
+
+def lsig0(word: UInt32) -> UInt32:
+    """
+    (lowercase sigma 0)
+
+    Computes rotr(7) ^ rotr(18) ^ rshift(3) of the input word.
+
+    Args:
+        word: (UInt32) The word to operate on.
+
+    Returns:
+        (UInt32) The resulting word.
+
+    """
+
+    x = word.value
+    return UInt32(_rotr(x, 7) ^ _rotr(x, 18) ^ (x >> 3))
+
+def lsig1(word: UInt32) -> UInt32:
+    """
+    (lowercase sigma 1)
+
+    Computes rotr(17) ^ rotr(19) ^ rshift(10) of the input word.
+
+    Args:
+        word: (UInt32) The word to operate on.
+
+    Returns:
+        (UInt32) The resulting word.
+
+    """
+
+    x = word.value
+    return UInt32(_rotr(x, 17) ^ _rotr(x, 19) ^ (x >> 10))
+
+def usig0(word: UInt32) -> UInt32:
+    """
+    (uppercase sigma 0)
+
+    Computes rotr(2) ^ rotr(13) ^ rotr(22) of the input word.
+
+    Args:
+        word: (UInt32) The word to operate on.
+
+    Returns:
+        (UInt32) The resulting word.
+
+    """
+
+    x = word.value
+    return UInt32(_rotr(x, 2) ^ _rotr(x, 13) ^ _rotr(x, 22))
+
+def usig1(word: UInt32) -> UInt32:
+    """
+    (uppercase sigma 1)
+
+    Computes rotr(6) ^ rotr(11) ^ rotr(25) of the input word.
+
+    Args:
+        word: (UInt32) The word to operate on.
+
+    Returns:
+        (UInt32) The resulting word.
+
+    """
+
+    x = word.value
+    return UInt32(_rotr(x, 6) ^ _rotr(x, 11) ^ _rotr(x, 25))
+
+def ch_into(dst: UInt32, a: UInt32, b: UInt32, c: UInt32) -> UInt32:
+    """
+    Writes ch(a, b, c) into 'dst' instead of a new word.
+
+    Args:
+        dst: (UInt32) The word to overwrite.
+        a: (UInt32) The model word.
+        b: (UInt32) The bits chosen if the model bit is 1.
+        c: (UInt32) The bits chosen if the model bit is 0.
+
+    Returns:
+        (UInt32) 'dst'.
+
+    """
+
+    x = a.value
+    dst.value = (x & b.value) ^ (~x & c.value)
+    return dst
+
+def maj_into(dst: UInt32, a: UInt32, b: UInt32, c: UInt32) -> UInt32:
+    """
+    Writes maj(a, b, c) into 'dst' instead of a new word.
+
+    Args:
+        dst: (UInt32) The word to overwrite.
+        a: (UInt32)
+        b: (UInt32)
+        c: (UInt32)
+
+    Returns:
+        (UInt32) 'dst'.
+
+    """
+
+    x, y, z = a.value, b.value, c.value
+    dst.value = (x & y) ^ (x & z) ^ (y & z)
+    return dst
+
+def usig0_into(dst: UInt32, word: UInt32) -> UInt32:
+    """
+    Writes usig0(word) into 'dst' instead of a new word.
+
+    Args:
+        dst: (UInt32) The word to overwrite.
+        word: (UInt32) The word to operate on.
+
+    Returns:
+        (UInt32) 'dst'.
+
+    """
+
+    x = word.value
+    dst.value = (((x >> 2) | (x << 30)) ^ ((x >> 13) | (x << 19)) ^ ((x >> 22) | (x << 10))) & MASK
+    return dst
+
+def usig1_into(dst: UInt32, word: UInt32) -> UInt32:
+    """
+    Writes usig1(word) into 'dst' instead of a new word.
+
+    Args:
+        dst: (UInt32) The word to overwrite.
+        word: (UInt32) The word to operate on.
+
+    Returns:
+        (UInt32) 'dst'.
+
+    """
+
+    x = word.value
+    dst.value = (((x >> 6) | (x << 26)) ^ ((x >> 11) | (x << 21)) ^ ((x >> 25) | (x << 7))) & MASK
+    return dst
+
+def _lsig0(x: int) -> int:
+    # lowercase sigma 0 of a raw 32-bit integer
+    return _rotr(x, 7) ^ _rotr(x, 18) ^ (x >> 3)
+
+def _lsig1(x: int) -> int:
+    # lowercase sigma 1 of a raw 32-bit integer
+    return _rotr(x, 17) ^ _rotr(x, 19) ^ (x >> 10)
+
+def toints(data) -> List[int]:
+    """
+    Splits bytes into big-endian raw-integer words.
+
+    Args:
+        data: (bytes) The bytes to split; any bytes-like object whose length
+            is a multiple of 4.
+
+    Returns:
+        (List[int]) The words.
+
+    """
+
+    return [
+        (data[i] << 24) | (data[i+1] << 16) | (data[i+2] << 8) | data[i+3]
+        for i in range(0, len(data), 4)
+    ]
+
+def tobytes(wds: List[int]) -> bytes:
+    """
+    Joins raw-integer words back into big-endian bytes.
+
+    Args:
+        wds: (List[int]) The words to join.
+
+    Returns:
+        (bytes) The joined bytes.
+
+    """
+
+    return b"".join([w.to_bytes(4, "big") for w in wds])
+
+def expand(w: List[int], start: int=16) -> None:
+    """
+    The raw-integer message schedule: fills w[start:64] in place, each word
+    from the four words it depends on. Callers that have already computed
+    some of w[16:start] themselves pass a later 'start'.
+
+    Args:
+        w: (List[int]) A 64-slot list whose first 'start' entries are set.
+        start: (int) The first word to compute.
+
+    """
+
+    for i in range(start, 64):
+        x, y = w[i-15], w[i-2]
+        s0 = (((x >> 7) | (x << 25)) ^ ((x >> 18) | (x << 14)) ^ (x >> 3)) & MASK
+        s1 = (((y >> 17) | (y << 15)) ^ ((y >> 19) | (y << 13)) ^ (y >> 10)) & MASK
+        w[i] = (s1 + w[i-7] + s0 + w[i-16]) & MASK
+
+def rounds(regs, kw: List[int]) -> Tuple[int, ...]:
+    """
+    The raw-integer compression rounds, one per entry of 'kw'. The round
+    constant and schedule word are passed already summed (K[i] + w[i]), so
+    sums that never change can be computed ahead of time. The working
+    registers are returned without being added back into the state.
+
+    Args:
+        regs: (Sequence[int]) The 8 registers (a, ..., h) to start from.
+        kw: (List[int]) K[i] + w[i] for every round to run, in order.
+
+    Returns:
+        (Tuple[int, ...]) The 8 registers after the last round.
+
+    """
+
+    a,b,c,d,e,f,g,h = regs
+    for x in kw:
+        s1 = (((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^ ((e >> 25) | (e << 7))) & MASK
+        t1 = h + s1 + ((e & f) ^ (~e & g)) + x
+        s0 = (((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^ ((a >> 22) | (a << 10))) & MASK
+        t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+        h = g
+        g = f
+        f = e
+        e = (d + t1) & MASK
+        d = c
+        c = b
+        b = a
+        a = (t1 + t2) & MASK
+    return a,b,c,d,e,f,g,h
+
+def compress_block(ctx: List[int], w: List[int]) -> None:
+    """
+    The raw-integer compression kernel, for hot loops that cannot afford a
+    UInt32 object per operation. The message schedule is expanded in place
+    into w[16:64] (w[0:16] is left untouched) and the block is compressed
+    into 'ctx' in place, so a caller can reuse both lists for every block.
+
+    Args:
+        ctx: (List[int]) The 8 state registers, updated in place.
+        w: (List[int]) A 64-slot list whose first 16 entries hold the
+            message block.
+
+    """
+
+    expand(w)
+
+    # the same loop as 'rounds', with K[i] + w[i] added inline, so that no
+    # list or tuple is built per block
+    a,b,c,d,e,f,g,h = ctx
+    for i in range(64):
+        s1 = (((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^ ((e >> 25) | (e << 7))) & MASK
+        t1 = h + s1 + ((e & f) ^ (~e & g)) + K[i] + w[i]
+        s0 = (((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^ ((a >> 22) | (a << 10))) & MASK
+        t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+        h = g
+        g = f
+        f = e
+        e = (d + t1) & MASK
+        d = c
+        c = b
+        b = a
+        a = (t1 + t2) & MASK
+
+    ctx[0] = (ctx[0] + a) & MASK
+    ctx[1] = (ctx[1] + b) & MASK
+    ctx[2] = (ctx[2] + c) & MASK
+    ctx[3] = (ctx[3] + d) & MASK
+    ctx[4] = (ctx[4] + e) & MASK
+    ctx[5] = (ctx[5] + f) & MASK
+    ctx[6] = (ctx[6] + g) & MASK
+    ctx[7] = (ctx[7] + h) & MASK
@@ -0,0 +1,85 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains hash_file and other auxiliary methods that
+#                  deal with hashing files and streams.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+import mmap
+import os
+import stat
+import sys
+from typing import BinaryIO
+from sha256.core.engines import Engine, UINT32
+from sha256.sha256 import Sha256
+
+# regular files at least this large are memory-mapped instead of read
+MMAP_THRESHOLD = 1 << 20
+
+# size of the reusable read buffer for pipes, stdin and small files
+CHUNK_SIZE = 1 << 20
+
+def hash_stream(stream: BinaryIO, engine: Engine=UINT32, size: int=0) -> str:
+    """
+    Computes the hash of a binary stream, such as a pipe or stdin. The stream
+    is read into one reusable buffer, so nothing but that buffer is held in
+    memory.
+
+    Args:
+        stream: (BinaryIO) The stream to read until EOF.
+        engine: (Engine) The word engine to run on.
+        size: (int) The expected size of the stream, if known. The buffer is
+            made no larger than that; 0 means unknown.
+
+    Returns:
+        (str) The hexadecimal digest of the stream's contents.
+
+    """
+
+    h = Sha256(engine=engine)
+    buf = bytearray(min(CHUNK_SIZE, size) if size > 0 else CHUNK_SIZE)
+    with memoryview(buf) as view:
+        while True:
+            n = stream.readinto(view)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+def hash_file(path: str, engine: Engine=UINT32) -> str:
+    """
+    Computes the hash of a file. Large regular files are memory-mapped and
+    their pages fed straight into the block pipeline; anything else (pipes,
+    character devices, small files) falls back to buffered reads. A path of
+    '-' reads stdin.
+
+    Args:
+        path: (str) The path of the file to hash, or '-' for stdin.
+        engine: (Engine) The word engine to run on.
+
+    Returns:
+        (str) The hexadecimal digest of the file's contents.
+
+    """
+
+    if path == "-":
+        return hash_stream(sys.stdin.buffer, engine)
+
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            return hash_stream(f, engine)
+        if st.st_size < MMAP_THRESHOLD:
+            # a buffer the size of the file; files such as those in /proc
+            # report a size of 0 and get the full chunk size
+            return hash_stream(f, engine, st.st_size)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            if hasattr(m, "madvise"):
+                m.madvise(mmap.MADV_SEQUENTIAL)
+            h = Sha256(engine=engine)
+            with memoryview(m) as view:
+                h.update(view)
+            return h.hexdigest()
@@ -0,0 +1,130 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains hash32 and hash64, specializations of the
+#                  hash function for 32-byte and 64-byte inputs (hashes of
+#                  hashes, Merkle nodes) whose padding never changes.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+from typing import Dict, List
+from sha256.const import H, K
+from sha256.core.uint_32 import MASK, _lsig0, _lsig1, expand, rounds, toints, tobytes
+from sha256.sha256 import Data, _view
+
+def _fold(const: Dict[int, int]) -> List[int]:
+    # the part of every schedule word w[16:32] that only depends on the
+    # constant words 'const' (index -> value); w[32:] no longer reads any
+    # word below 16 directly
+    folded = [0]*32
+    for i in range(16, 32):
+        for j, term in ((i-2, _lsig1), (i-7, None), (i-15, _lsig0), (i-16, None)):
+            if j in const:
+                folded[i] += term(const[j]) if term else const[j]
+    return folded
+
+# a 32-byte message fills w[0:8]; w[8:16] is the '1' bit, zeros and the bit
+# length (256), so the sums that read them are folded ahead of time
+_PAD32 = {8: 0x80000000, 9: 0, 10: 0, 11: 0, 12: 0, 13: 0, 14: 0, 15: 256}
+_TAIL32 = list(_PAD32.values()) + [0]*48
+_FOLD32 = _fold(_PAD32)
+
+# the first round of a first block starts from the constant H, so all of it
+# but the addition of w[0] to the new 'a' and 'e' is computed once
+_A0, _, _, _, _E0, _, _, _ = rounds(H, [K[0]])
+_K1 = K[1:]
+
+def _from_h(w: List[int]) -> List[int]:
+    # compresses the expanded first block 'w' from H and returns the new
+    # context
+    w0 = w[0]
+    regs = ((_A0 + w0) & MASK, H[0], H[1], H[2], (_E0 + w0) & MASK, H[4], H[5], H[6])
+    regs = rounds(regs, [k + x for k, x in zip(_K1, w[1:])])
+    return [(h + x) & MASK for h, x in zip(H, regs)]
+
+# a 64-byte message fills the first block; the second block is padding only
+# ('1' bit, zeros and the bit length 512), so its whole schedule, plus the
+# round constants, is computed once
+_PAD64 = [0x80000000] + [0]*14 + [512] + [0]*48
+expand(_PAD64)
+_KW64 = [k + w for k, w in zip(K, _PAD64)]
+
+def hash32(data: Data) -> bytes:
+    """
+    Computes the SHA-256 digest of exactly 32 bytes, such as another digest.
+    The message is a single block whose second half is constant padding:
+    the padding words and the parts of w[16:32] that depend on them are
+    precomputed, as is the first round, which starts from the constant
+    initial state. The rounds run on the raw-integer kernel.
+
+    Args:
+        data: (Data) The 32-byte input.
+
+    Returns:
+        (bytes) The 32-byte digest.
+
+    Raises:
+        (ValueError) Raised if the input is not 32 bytes long.
+
+    """
+
+    view = _view(data)
+    if len(view) != 32:
+        raise ValueError("hash32 takes exactly 32 bytes")
+
+    w = toints(view) + _TAIL32
+    c = _FOLD32
+    # w[16:32] with every constant term already folded into 'c'; the sigmas
+    # are written out as in expand, since a call per sigma costs more than
+    # the folding saves
+    x = w[1]
+    w[16] = (c[16] + ((((x >> 7) | (x << 25)) ^ ((x >> 18) | (x << 14)) ^ (x >> 3)) & MASK) + w[0]) & MASK
+    x = w[2]
+    w[17] = (c[17] + ((((x >> 7) | (x << 25)) ^ ((x >> 18) | (x << 14)) ^ (x >> 3)) & MASK) + w[1]) & MASK
+    for i in range(18, 23):
+        x, y = w[i-15], w[i-2]
+        s0 = (((x >> 7) | (x << 25)) ^ ((x >> 18) | (x << 14)) ^ (x >> 3)) & MASK
+        s1 = (((y >> 17) | (y << 15)) ^ ((y >> 19) | (y << 13)) ^ (y >> 10)) & MASK
+        w[i] = (c[i] + s1 + s0 + w[i-16]) & MASK
+    y = w[21]
+    w[23] = (c[23] + ((((y >> 17) | (y << 15)) ^ ((y >> 19) | (y << 13)) ^ (y >> 10)) & MASK) + w[16] + w[7]) & MASK
+    for i in range(24, 31):
+        y = w[i-2]
+        w[i] = (c[i] + ((((y >> 17) | (y << 15)) ^ ((y >> 19) | (y << 13)) ^ (y >> 10)) & MASK) + w[i-7]) & MASK
+    x, y = w[16], w[29]
+    s0 = (((x >> 7) | (x << 25)) ^ ((x >> 18) | (x << 14)) ^ (x >> 3)) & MASK
+    s1 = (((y >> 17) | (y << 15)) ^ ((y >> 19) | (y << 13)) ^ (y >> 10)) & MASK
+    w[31] = (c[31] + s1 + w[24] + s0) & MASK
+    expand(w, 32)
+
+    return tobytes(_from_h(w))
+
+def hash64(data: Data) -> bytes:
+    """
+    Computes the SHA-256 digest of exactly 64 bytes, such as the
+    concatenation of two digests (a Merkle node). The first block is the
+    message itself, whose first round is precomputed as in hash32; the
+    second is padding only, so its schedule and round sums are precomputed
+    and only its rounds are run.
+
+    Args:
+        data: (Data) The 64-byte input.
+
+    Returns:
+        (bytes) The 32-byte digest.
+
+    Raises:
+        (ValueError) Raised if the input is not 64 bytes long.
+
+    """
+
+    view = _view(data)
+    if len(view) != 64:
+        raise ValueError("hash64 takes exactly 64 bytes")
+
+    w = toints(view) + [0]*48
+    expand(w)
+    ctx = _from_h(w)
+    regs = rounds(ctx, _KW64)
+    return tobytes([(h + x) & MASK for h, x in zip(ctx, regs)])
@@ -0,0 +1,146 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains HMAC and other auxiliary methods that deal
+#                  with keyed hashing (HMAC-SHA256, RFC 2104).
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+from sha256.core.engines import Engine, UINT32
+from sha256.sha256 import Sha256, Data, _view
+
+IPAD = 0x36
+OPAD = 0x5c
+
+class HMAC:
+    """
+    A streaming HMAC-SHA256 object. The padded key XOR'd with 'ipad' and
+    'opad' is compressed once, when the object is created, and the two
+    resulting midstates are kept; each message then only costs its own
+    blocks plus a single outer finalization block. Use 'copy' to MAC many
+    messages under one key without recompressing the key blocks.
+
+    Example:
+        >>> mac = HMAC(b"key")
+        >>> m = mac.copy()
+        >>> m.update(b"The quick brown fox jumps over the lazy dog")
+        >>> m.hexdigest()
+        'f7bc83f430538424b13298e6aa6fb143ef4d59a14946175997479dbc2d1a3cd8'
+
+    """
+
+    name = "hmac-sha256"
+    digest_size = 32
+    block_size = 64
+
+    def __init__(self, key: Data, msg: Data=b"", engine: Engine=UINT32) -> None:
+        """
+        Args:
+            key: (Data) The secret key. Keys longer than one block are hashed
+                first, as RFC 2104 requires.
+            msg: (Data) Optional initial data, passed to 'update'.
+            engine: (Engine) The word engine to run on.
+
+        """
+
+        key = bytes(_view(key))
+        if len(key) > self.block_size:
+            key = Sha256(key, engine).digest()
+        key = key.ljust(self.block_size, b"\x00")
+
+        self.engine = engine
+        # each pad is exactly one block, so both are compressed right away
+        self._inner = Sha256(bytes(k ^ IPAD for k in key), engine)
+        self._outer = Sha256(bytes(k ^ OPAD for k in key), engine)
+        self.update(msg)
+
+    def update(self, msg: Data) -> None:
+        """
+        Feeds more data into the MAC.
+
+        Args:
+            msg: (Data) The data to append to the message.
+
+        """
+
+        self._inner.update(msg)
+
+    def digest(self) -> bytes:
+        """
+        Returns:
+            (bytes) The 32-byte MAC of the data passed so far. The object
+                itself is left unchanged.
+
+        """
+
+        return self._finish().digest()
+
+    def hexdigest(self) -> str:
+        """
+        Returns:
+            (str) The hexadecimal MAC of the data passed so far. The object
+                itself is left unchanged.
+
+        """
+
+        return self._finish().hexdigest()
+
+    def _finish(self) -> Sha256:
+        # the outer hash resumes from the opad midstate
+        outer = self._outer.copy()
+        outer.update(self._inner.digest())
+        return outer
+
+    def midstates(self) -> tuple:
+        """
+        Returns:
+            (tuple) The inner and outer midstates, as returned by
+                Sha256.midstate. Only available before any message data has
+                been fed in.
+
+        Raises:
+            (ValueError) Raised if message data has already been fed in.
+
+        """
+
+        try:
+            inner = self._inner.midstate()
+        except ValueError:
+            inner = None
+        if inner is None or inner[1] != self.block_size:
+            raise ValueError("midstates are only available before update")
+        return inner, self._outer.midstate()
+
+    def copy(self) -> "HMAC":
+        """
+        Forks the MAC, sharing the precomputed key midstates.
+
+        Returns:
+            (HMAC) An independent MAC with the same state.
+
+        """
+
+        other = self.__class__.__new__(self.__class__)
+        other.engine = self.engine
+        other._inner = self._inner.copy()
+        other._outer = self._outer
+        return other
+
+def hmac_sha256(key: Data, msg: Data, engine: Engine=UINT32) -> str:
+    """
+    Computes the HMAC-SHA256 of a message. Nothing is kept between calls, so
+    the key blocks are compressed every time; to sign many messages under
+    one key, create an HMAC once and 'copy' it per message instead.
+
+    Args:
+        key: (Data) The secret key.
+        msg: (Data) The message to authenticate.
+        engine: (Engine) The word engine to run on.
+
+    Returns:
+        (str) The hexadecimal MAC.
+
+    """
+
+    return HMAC(key, msg, engine).hexdigest()
@@ -0,0 +1,155 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains instrument, an opt-in context that counts
+#                  word operations and times each stage of the hash function.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+import sha256.sha256 as _sha256
+import sha256.core.ubitarray_32 as _ubitarray_32
+from sha256.core.ubitarray_32 import UBitArray32
+from sha256.core.uint_32 import UInt32
+
+# word-level operations that are counted, and the methods that perform them
+COUNTERS = {
+    "words": ("__init__", "_wrap"),
+    "adds": ("__add__", "__iadd__", "add_into", "add_many"),
+    "xors": ("__xor__", "__ixor__"),
+    "rotations": ("rotr", "rotr_into"),
+    "shifts": ("rshift",),
+}
+
+# stages that are timed, and the functions in sha256.sha256 that run them;
+# 'tohex' is timed on the word types instead
+STAGES = {
+    "words": "_words",
+    "padding": "_padding",
+    "schedule": "schedule",
+    "compress": "compress",
+}
+
+class Report:
+    """
+    The operation counts and stage timings collected by 'instrument'.
+
+    Attributes:
+        counts: (Dict[str, int]) Word allocations ('words'), 'adds', 'xors',
+            'rotations', 'shifts', fused 'sigmas' and 'blocks' compressed.
+        seconds: (Dict[str, float]) Time spent per stage: block-to-word
+            conversion ('words'), 'padding', 'schedule', 'compress' and
+            'tohex'. Stages nest; 'compress' includes its word operations
+            and, when hashing, the on-demand schedule of 'process_block'
+            ('schedule' only times the standalone function).
+        calls: (Dict[str, int]) The number of calls per stage.
+
+    """
+
+    def __init__(self) -> None:
+        self.counts = dict.fromkeys(list(COUNTERS) + ["sigmas", "blocks"], 0)
+        self.seconds = dict.fromkeys(list(STAGES) + ["tohex"], 0.0)
+        self.calls = dict.fromkeys(self.seconds, 0)
+
+    def as_dict(self) -> Dict:
+        """
+        Returns:
+            (Dict) A JSON-serializable copy of the report, for example:
+                {"counts": {"words": 5202, ...},
+                 "stages": {"schedule": {"seconds": 0.01, "calls": 1}, ...}}
+
+        """
+
+        return {
+            "counts": dict(self.counts),
+            "stages": {
+                stage: {"seconds": self.seconds[stage], "calls": self.calls[stage]}
+                for stage in self.seconds
+            },
+        }
+
+def _counting(report: Report, counter: str, fn: Callable) -> Callable:
+    def wrapper(*args, **kwargs):
+        report.counts[counter] += 1
+        return fn(*args, **kwargs)
+    return wrapper
+
+def _timing(report: Report, stage: str, fn: Callable) -> Callable:
+    def wrapper(*args, **kwargs):
+        began = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            report.seconds[stage] += time.perf_counter() - began
+            report.calls[stage] += 1
+    return wrapper
+
+_active = False
+
+@contextmanager
+def instrument() -> Iterator[Report]:
+    """
+    Collects operation counts and stage timings for every hash computed
+    inside the context. Instrumentation works by temporarily wrapping the
+    word methods and stage functions, so nothing is wrapped and nothing is
+    paid while it is disabled. It is process-wide and not thread-safe, and
+    contexts cannot be nested.
+
+    Word operations are counted where they go through the word type's
+    methods; UInt32's sigma, choice and majority functions work on the raw
+    integer and only show up as the word they allocate, and their '_into'
+    variants (used by 'compress') allocate none. UBitArray32's sigma
+    functions are fused into one pass over the bits, so they are counted as
+    'sigmas' rather than as three rotations/shifts and two XORs.
+
+    Example:
+        >>> with instrument() as report:
+        ...     SHA256("abc", UBITARRAY32)
+        >>> report.counts["blocks"]
+        1
+
+    Returns:
+        (Iterator[Report]) The report, filled in as hashes are computed.
+
+    Raises:
+        (RuntimeError) Raised if an instrument context is already active.
+
+    """
+
+    global _active
+    if _active:
+        raise RuntimeError("instrumentation is already active")
+
+    report = Report()
+    patches: List[Tuple[object, str, Callable]] = []
+
+    def patch(owner: object, name: str, wrapper: Callable) -> None:
+        # the raw attribute is saved (and restored) so that classmethods
+        # stay classmethods
+        patches.append((owner, name, vars(owner)[name]))
+        setattr(owner, name, wrapper)
+
+    for cls in (UBitArray32, UInt32):
+        for counter, methods in COUNTERS.items():
+            for method in methods:
+                raw = vars(cls).get(method)
+                if isinstance(raw, classmethod):
+                    patch(cls, method, classmethod(_counting(report, counter, raw.__func__)))
+                elif raw is not None:
+                    patch(cls, method, _counting(report, counter, raw))
+        patch(cls, "tohex", _timing(report, "tohex", cls.tohex))
+    patch(_ubitarray_32, "_sigma", _counting(report, "sigmas", _ubitarray_32._sigma))
+    for stage, name in STAGES.items():
+        patch(_sha256, name, _timing(report, stage, getattr(_sha256, name)))
+    patch(_sha256, "compress", _counting(report, "blocks", _sha256.compress))
+
+    _active = True
+    try:
+        yield report
+    finally:
+        for owner, name, original in reversed(patches):
+            setattr(owner, name, original)
+        _active = False
@@ -0,0 +1,95 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains pbkdf2_hmac_sha256 and other auxiliary
+#                  methods that deal with key derivation (PBKDF2, RFC 8018).
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from sha256.core.engines import UINT32
+from sha256.core.uint_32 import compress_block, toints, tobytes
+from sha256.hmac import HMAC
+from sha256.sha256 import Data, _view
+
+def _block(password: bytes, salt: bytes, iterations: int, index: int) -> bytes:
+    # computes T_index = U_1 ^ U_2 ^ ... ^ U_iterations
+    mac = HMAC(password, engine=UINT32)
+    (inner, _), (outer, _) = mac.midstates()
+    inner = [w.toint() for w in inner]
+    outer = [w.toint() for w in outer]
+
+    first = mac.copy()
+    first.update(salt + bytes((index >> shift) & 0xff for shift in (24, 16, 8, 0)))
+    u = toints(first.digest())
+    t = list(u)
+
+    # every later U is the HMAC of a 32-byte input, so both the inner and
+    # the outer hash are a single block whose last 8 words never change:
+    # the '1' bit, zeros and the bit length (one key block + 32 bytes)
+    w = [0]*64
+    w[8] = 0x80000000
+    w[15] = (64 + 32) * 8
+    state = [0]*8
+
+    # the buffers above are reused by every iteration; compress_block only
+    # writes w[16:64], so w[8:16] is built once
+    for _ in range(iterations - 1):
+        w[0:8] = u
+        state[0:8] = inner
+        compress_block(state, w)
+        w[0:8] = state
+        state[0:8] = outer
+        compress_block(state, w)
+        u[0:8] = state
+        for j in range(8):
+            t[j] ^= u[j]
+
+    return tobytes(t)
+
+def pbkdf2_hmac_sha256(password: Data, salt: Data, iterations: int, dklen: Optional[int]=None,
+                       workers: int=1) -> bytes:
+    """
+    Derives a key with PBKDF2 using HMAC-SHA256 as the pseudorandom function.
+    The key midstates are computed once, the constant padding words of the
+    fixed-size inner and outer blocks are prebuilt, and the iteration loop
+    runs the raw-integer compression kernel over reused word buffers.
+
+    Args:
+        password: (Data) The password.
+        salt: (Data) The salt.
+        iterations: (int) The iteration count.
+        dklen: (int) The length of the derived key in bytes. Defaults to 32.
+        workers: (int) The number of worker processes. Each 32-byte block of
+            the derived key is independent, so with 'workers' > 1 blocks are
+            computed in parallel.
+
+    Returns:
+        (bytes) The derived key.
+
+    Raises:
+        (ValueError) Raised if 'iterations' or 'dklen' is less than 1.
+
+    """
+
+    if iterations < 1:
+        raise ValueError("iterations must be at least 1")
+    dklen = 32 if dklen is None else dklen
+    if dklen < 1:
+        raise ValueError("dklen must be at least 1")
+
+    password = bytes(_view(password))
+    salt = bytes(_view(salt))
+    indices = range(1, (dklen + 31) // 32 + 1)
+
+    if workers > 1 and len(indices) > 1:
+        n = len(indices)
+        with ProcessPoolExecutor(min(workers, n)) as pool:
+            blocks = pool.map(_block, [password]*n, [salt]*n, [iterations]*n, indices)
+            key = b"".join(blocks)
+    else:
+        key = b"".join(_block(password, salt, iterations, i) for i in indices)
+
+    return key[:dklen]
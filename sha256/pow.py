@@ -0,0 +1,173 @@
+# ============================================================================ #
+# Author: Greyson Murray (greyson.murray@gmail.com)
+#
+# Description: This file contains sha256d and search_nonce, which deal with
+#                  double hashing and proof-of-work over 80-byte headers.
+#
+# LICENSE: MIT
+# ============================================================================ #
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional, Tuple
+from sha256.const import H, K
+from sha256.core.engines import Engine, UINT32
+from sha256.core.uint_32 import MASK, _lsig0, _lsig1, _rotr, compress_block, expand, rounds, toints, tobytes
+from sha256.fixed import hash32
+from sha256.sha256 import Sha256, SHA256, Data, _view
+
+def sha256d(data: Data, engine: Engine=UINT32) -> str:
+    """
+    Computes the double hash, SHA256(SHA256(data)), where the outer hash is
+    taken over the 32-byte digest of the inner one. On the integer engine
+    the outer hash runs through the fixed-length hash32.
+
+    Args:
+        data: (Data) The input data.
+        engine: (Engine) The word engine to run on.
+
+    Returns:
+        (str) The hexadecimal digest of the double hash.
+
+    """
+
+    inner = Sha256(data, engine).digest()
+    if engine is UINT32:
+        return hash32(inner).hex()
+    return SHA256(inner, engine)
+
+class NonceResult(NamedTuple):
+    """
+    The outcome of a nonce search. 'nonce' and 'hash' are None if no nonce
+    in the range met the target.
+
+    """
+
+    nonce: Optional[int]
+    hash: Optional[str]
+    hashes: int
+    seconds: float
+    rate: float
+
+def _bswap(x: int) -> int:
+    # reverses the byte order of a 32-bit word
+    return ((x & 0xff) << 24) | ((x & 0xff00) << 8) | ((x >> 8) & 0xff00) | (x >> 24)
+
+def _scan(header: bytes, target: int, start: int, stop: int) -> Tuple[Optional[int], Optional[str], int]:
+    # searches [start, stop) for the first nonce meeting 'target'; runs in a
+    # worker process when the range is split
+
+    # first block: compressed once
+    mid = list(H)
+    w = toints(header[:64]) + [0]*48
+    compress_block(mid, w)
+
+    # second block: header[64:76], the nonce, then constant padding for an
+    # 80-byte (640-bit) message
+    w = toints(header[64:76]) + [0, 0x80000000] + [0]*10 + [640] + [0]*48
+
+    # schedule words that do not depend on the nonce (w[3]), and the
+    # constant parts of the first two that do
+    w[16] = (_lsig1(w[14]) + w[9] + _lsig0(w[1]) + w[0]) & MASK
+    w[17] = (_lsig1(w[15]) + w[10] + _lsig0(w[2]) + w[1]) & MASK
+    w18 = _lsig1(w[16]) + w[11] + w[2]
+    w19 = _lsig1(w[17]) + w[12] + _lsig0(w[4])
+
+    # the first three rounds do not depend on the nonce either
+    early = rounds(mid, [K[i] + w[i] for i in range(3)])
+    a,b,c,d,e,f,g,h = early
+    # round 3 up to the addition of the nonce word
+    t1_3 = (h + (_rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)) + ((e & f) ^ (~e & g)) + K[3]) & MASK
+
+    # rounds 4-15 read no word that depends on the nonce
+    kw = [K[i] + w[i] for i in range(4, 16)]
+    k = K[16:]
+
+    # the outer hash is a single block: the 32-byte digest and constant
+    # padding for a 256-bit message
+    w2 = [0]*8 + [0x80000000] + [0]*6 + [256] + [0]*48
+    state = [0]*8
+    # cheap reject on the most significant word of the little-endian hash
+    top = target >> 224
+
+    for nonce in range(start, stop):
+        n = _bswap(nonce)
+        w[3] = n
+        w[18] = (w18 + _lsig0(n)) & MASK
+        w[19] = (w19 + n) & MASK
+        expand(w, 20)
+
+        a,b,c,d,e,f,g,h = early
+        t1 = t1_3 + n
+        t2 = (_rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c))
+        h, g, f, e, d, c, b, a = g, f, e, (d + t1) & MASK, c, b, a, (t1 + t2) & MASK
+        a,b,c,d,e,f,g,h = rounds((a,b,c,d,e,f,g,h), kw + [x + y for x, y in zip(k, w[16:])])
+
+        w2[0] = (mid[0] + a) & MASK
+        w2[1] = (mid[1] + b) & MASK
+        w2[2] = (mid[2] + c) & MASK
+        w2[3] = (mid[3] + d) & MASK
+        w2[4] = (mid[4] + e) & MASK
+        w2[5] = (mid[5] + f) & MASK
+        w2[6] = (mid[6] + g) & MASK
+        w2[7] = (mid[7] + h) & MASK
+        state[0:8] = H
+        compress_block(state, w2)
+
+        if _bswap(state[7]) > top:
+            continue
+        digest = tobytes(state)
+        if int.from_bytes(digest, "little") <= target:
+            return nonce, digest.hex(), nonce - start + 1
+
+    return None, None, stop - start
+
+def search_nonce(header: Data, target: int, start: int=0, stop: int=2**32,
+                 workers: int=1) -> NonceResult:
+    """
+    Searches for a nonce that makes the double hash of an 80-byte header meet
+    a target. As in Bitcoin, the nonce occupies the last 4 header bytes
+    (little-endian) and the digest is read as a little-endian integer, which
+    must be at most 'target'. The first block, the schedule words and the
+    early rounds that do not depend on the nonce are computed only once.
+
+    Args:
+        header: (Data) The 80-byte header; its last 4 bytes are ignored.
+        target: (int) The largest acceptable hash value.
+        start: (int) The first nonce to try.
+        stop: (int) One past the last nonce to try.
+        workers: (int) The number of worker processes to split the range
+            over.
+
+    Returns:
+        (NonceResult) The smallest nonce found (or None), its hash, the
+            number of hashes computed, the time taken and the hash rate in
+            hashes per second.
+
+    Raises:
+        (ValueError) Raised if the header is not 80 bytes or the range is
+            not within [0, 2**32].
+
+    """
+
+    header = bytes(_view(header))
+    if len(header) != 80:
+        raise ValueError("header must be 80 bytes")
+    if not 0 <= start <= stop <= 2**32:
+        raise ValueError("nonce range must be within [0, 2**32]")
+
+    began = time.perf_counter()
+    if workers > 1 and stop - start > workers:
+        step = -(-(stop - start) // workers)
+        bounds = [(lo, min(lo + step, stop)) for lo in range(start, stop, step)]
+        with ProcessPoolExecutor(len(bounds)) as pool:
+            futures = [pool.submit(_scan, header, target, lo, hi) for lo, hi in bounds]
+            results = [future.result() for future in futures]
+    else:
+        results = [_scan(header, target, start, stop)]
+    seconds = time.perf_counter() - began
+
+    hashes = sum(count for _, _, count in results)
+    found = [(nonce, digest) for nonce, digest, _ in results if nonce is not None]
+    nonce, digest = min(found) if found else (None, None)
+    return NonceResult(nonce, digest, hashes, seconds, hashes / seconds if seconds else 0.0)
@@ -7,64 +7,229 @@
 # LICENSE: MIT
 # ============================================================================ #
 
-from typing import List, Tuple
-from sha256.core.ubitarray_32 import UBitArray32, lsig0, lsig1, usig0, usig1, ch, maj
-from sha256.core.bitops import binary, prepad
-from sha256.const import H, K
-from sha256.const.tables import ASCII
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, Iterator, List, Tuple, Union
+from sha256.core.engines import Engine, UINT32, engine_of
+from sha256.const import cached_word, h_words, k_words
 
-def schedule(wds: List[UBitArray32]) -> List[UBitArray32]:
+# anything exposing the buffer protocol (bytes, bytearray, memoryview, ...)
+# or a string, which is encoded as UTF-8
+Data = Union[str, bytes, bytearray, memoryview]
+
+# the number of message lengths whose padding-only final block schedule is
+# kept by '_padding_schedule'
+SCHEDULE_CACHE_SIZE = 256
+
+def _view(data) -> memoryview:
+    # exposes the input as a flat memoryview of bytes without copying it;
+    # strings are encoded as UTF-8 first
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    view = memoryview(data)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
+
+def _padding(nbytes: int) -> bytes:
+    # the '1' bit, '0' bits up to 448 (mod 512), and the 64-bit bit length
+    bitlen = nbytes * 8
+    if bitlen > (2**64)-1:
+        raise ValueError("input is too large")
+    zeros = (55 - nbytes) % 64
+    length = bytes((bitlen >> shift) & 0xff for shift in range(56, -1, -8))
+    return b"\x80" + bytes(zeros) + length
+
+def _words(block, engine: Engine, pad: int=16) -> List:
+    # splits a 64-byte block into 16 big-endian words; the words from index
+    # 'pad' on hold nothing but padding and the message length, which recur
+    # across messages, so only those are memoized
+    fromint = engine.word.fromint
+    pad = min(max(pad, 0), 16) * 4
+    wds = [
+        fromint((block[i] << 24) | (block[i+1] << 16) | (block[i+2] << 8) | block[i+3])
+        for i in range(0, pad, 4)
+    ]
+    word = engine.word
+    wds += [
+        cached_word(word, (block[i] << 24) | (block[i+1] << 16) | (block[i+2] << 8) | block[i+3])
+        for i in range(pad, 64, 4)
+    ]
+    return wds
+
+def _split(buf: bytearray, view: memoryview) -> Iterator[Union[memoryview, bytes]]:
+    # yields every full 64-byte block of the partial block 'buf' followed by
+    # 'view': first 'buf' topped up from 'view' (copied), then views into
+    # 'view' itself; whatever is left over is appended to 'buf'
+    n = len(view)
+    i = 0
+    if buf:
+        # top up the partial block first
+        i = min(64 - len(buf), n)
+        buf += view[:i]
+        if len(buf) < 64:
+            return
+        yield bytes(buf)
+        buf.clear()
+
+    while n - i >= 64:
+        yield view[i:i+64]
+        i += 64
+
+    buf += view[i:]
+
+def blocks(chunks: Iterable[Data]) -> Iterator[Union[memoryview, bytes]]:
+    """
+    Splits a stream of data into padded 512-bit (64-byte) message blocks.
+    Blocks are yielded one at a time as the chunks arrive; full blocks are
+    views into the incoming chunks and only a partial block is ever buffered.
+    The final one or two padded blocks are built from the running length, so
+    memory use does not depend on the size of the input.
+
+    Example:
+        >>> [len(block) for block in blocks([b"a"*60, b"b"*10])]
+        [64, 64]
+
+    Args:
+        chunks: (Iterable[Data]) The pieces of the message, in order.
+
+    Returns:
+        (Iterator[memoryview or bytes]) The 64-byte message blocks.
+
+    """
+
+    buf = bytearray()
+    length = 0
+    for chunk in chunks:
+        view = _view(chunk)
+        length += len(view)
+        yield from _split(buf, view)
+
+    # pad out message to factor of 512 (512-bit blocks)
+    tail = bytes(buf) + _padding(length)
+    for i in range(0, len(tail), 64):
+        yield tail[i:i+64]
+
+def schedule(wds: List, engine: Engine=None) -> List:
     """
     Expands 16 words (each 32-bit) into a 64-word message schedule for
     compression. Making use of both 'σ0' and 'σ1' (lowercase sigma rotational 
     functions), new words are composed using the bits of previous words.
 
     Args:
-        wds: (List[UBitArray32]) The original 16 words.
+        wds: (List) The original 16 words.
+        engine: (Engine) The engine the words belong to. If not supplied, it
+            is inferred from the type of the words.
 
     Returns:
-        (List[UBitArray32]) The final 64 words (message schedule).
+        (List) The final 64 words (message schedule).
 
     """
 
+    engine = engine or engine_of(wds[0])
+    lsig0, lsig1 = engine.lsig0, engine.lsig1
+    add_many = engine.word.add_many
     for i in range(len(wds), 64):
-        w = lsig1(wds[i-2]) + wds[i-7] + lsig0(wds[i-15]) + wds[i-16]
-        wds.append(w)
+        wds.append(add_many(lsig1(wds[i-2]), wds[i-7], lsig0(wds[i-15]), wds[i-16]))
 
     return wds
 
-def compress(wds: List[UBitArray32], ctx: Tuple[UBitArray32]=None) -> Tuple[UBitArray32]:
+def rolling_schedule(wds: List, engine: Engine=None) -> Iterator:
+    """
+    Generates the same 64 words as 'schedule', but on demand: each new word
+    overwrites the slot of the word 16 positions back in a 16-slot ring
+    buffer, which is the oldest word any later word still depends on. Only
+    16 words are alive at any time and nothing is expanded ahead of use.
+
+    Args:
+        wds: (List) The original 16 words; the list is not modified.
+        engine: (Engine) The engine the words belong to. If not supplied, it
+            is inferred from the type of the words.
+
+    Returns:
+        (Iterator) The 64 words of the message schedule, in order.
+
+    """
+
+    engine = engine or engine_of(wds[0])
+    lsig0, lsig1 = engine.lsig0, engine.lsig1
+    add_many = engine.word.add_many
+    ring = list(wds)
+    yield from ring
+    for i in range(16, 64):
+        # slot 'j' still holds w[i-16]
+        j = i & 15
+        w = add_many(lsig1(ring[(i-2) & 15]), ring[(i-7) & 15], lsig0(ring[(i-15) & 15]), ring[j])
+        ring[j] = w
+        yield w
+
+def compress(wds: List, ctx: Tuple=None, engine: Engine=None) -> Tuple:
     """
     Compresses each word into eight state registers (a, b, c, d, e, f, g, h).
     New state is computed using '∑0' and '∑1' (uppercase sigma rotational
     methods) as well as the 'ch' (choice) and 'maj' (majority) methods.
 
     Args:
-        wds: (List[UBitArray32]) The 64 words of the incoming message schedule.
+        wds: (Iterable) The 64 words of the incoming message schedule, in
+            order; a list from 'schedule' or the words of 'rolling_schedule'.
+        ctx: (Tuple) The context of a previous compression. If not supplied,
+            the initial hash values are used.
+        engine: (Engine) The engine the words belong to. If not supplied, it
+            is inferred from the type of the first word.
 
     Returns:
-        (Tuple[UBitArray32]) The resulting context of the
-            state registers.
+        (Tuple) The resulting context of the state registers.
+
+    Raises:
+        (ValueError) Raised if the schedule does not hold exactly 64 words.
 
     """
 
+    # the schedule may be a generator, so its length is only known once it
+    # has been consumed
+    words = iter(wds)
+    if engine is None:
+        first = next(words, None)
+        if first is None:
+            raise ValueError("message schedule must contain exactly 64 words")
+        engine = engine_of(first)
+        words = chain((first,), words)
+
+    word, ch_into, maj_into = engine.word, engine.ch_into, engine.maj_into
+    usig0_into, usig1_into = engine.usig0_into, engine.usig1_into
+    k = k_words(word)
+
     # set initial state registers
     # if ctx is not supplied, use defined constants
-    state = ctx or tuple(UBitArray32.fromint(h) for h in H)
-    a,b,c,d,e,f,g,h = state
+    state = ctx or h_words(word)
+    # the registers are private copies, so the in-place operations below
+    # never touch 'ctx' (which may be shared) or the schedule
+    a,b,c,d,e,f,g,h = (x.copy() for x in state)
+    # temporaries, overwritten every round
+    s1, tc, t1, t2, tm = (word.fromint(0) for _ in range(5))
 
-    for i in range(64):
-        t1 = usig1(e) + ch(e,f,g) + h + UBitArray32.fromint(K[i]) + wds[i]
-        t2 = usig0(a) + maj(a,b,c)
-        # assign registers to previous (b=a, c=b, etc.)
+    n = 0
+    for kt, wt in zip(k, words):
+        n += 1
+        # the five-term sum is carry-saved, with a single carry propagation
+        t1.add_into(usig1_into(s1, e), ch_into(tc, e,f,g), h, kt, wt)
+        usig0_into(t2, a)
+        t2 += maj_into(tm, a,b,c)
+        # assign registers to previous (b=a, c=b, etc.); the buffers of the
+        # outgoing 'h' and 'd' are reused for the new 'e' and 'a'
+        free = h
         h = g
         g = f
         f = e
-        e = d + t1
+        e = free.add_into(d, t1)
+        free = d
         d = c
         c = b
         b = a
-        a = t1 + t2
+        a = free.add_into(t1, t2)
+
+    if n != 64 or next(words, None) is not None:
+        raise ValueError("message schedule must contain exactly 64 words")
 
     # add new state to original state
     a += state[0]
@@ -78,49 +243,225 @@ def compress(wds: List[UBitArray32], ctx: Tuple[UBitArray32]=None) -> Tuple[UBit
 
     return a,b,c,d,e,f,g,h
 
-def SHA256(data: str) -> str:
+def process_block(wds: List, ctx: Tuple=None, engine: Engine=None) -> Tuple:
+    """
+    Compresses one message block, generating each schedule word from a
+    rolling 16-word window as the round that consumes it runs, instead of
+    expanding all 64 words first. Equivalent to
+    compress(schedule(wds), ctx, engine).
+
+    Args:
+        wds: (List) The 16 words of the message block.
+        ctx: (Tuple) The context of a previous compression. If not supplied,
+            the initial hash values are used.
+        engine: (Engine) The engine the words belong to. If not supplied, it
+            is inferred from the type of the words.
+
+    Returns:
+        (Tuple) The resulting context of the state registers.
+
+    """
+
+    engine = engine or engine_of(wds[0])
+    return compress(rolling_schedule(wds, engine), ctx, engine)
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _padding_schedule(bitlen: int, engine: Engine) -> Tuple:
+    # the expanded schedule of a final block that holds nothing but padding,
+    # which only depends on the message length; the words are shared, so they
+    # are frozen
+    block = _padding(bitlen // 8)[-64:]
+    return tuple(w.freeze() for w in schedule(_words(block, engine, 0), engine))
+
+def _finish(tail, nbytes: int, ctx: Tuple, engine: Engine) -> Tuple:
+    # compresses the trailing partial block 'tail' of an 'nbytes'-long message
+    # and its padding into 'ctx'; when the last block is padding only (the
+    # message fills its final block exactly, or leaves no room for the length)
+    # its schedule is taken from the cache
+    padded = bytes(tail) + _padding(nbytes)
+    last = len(padded) - 64
+    # the index of the first word (across 'padded') with no message bytes
+    pad = (len(tail) + 3) // 4
+    for i in range(0, last, 64):
+        ctx = process_block(_words(padded[i:i+64], engine, pad - i//4), ctx, engine)
+    if len(tail) == 0 or len(tail) > 55:
+        return compress(_padding_schedule(nbytes * 8, engine), ctx, engine)
+    return process_block(_words(padded[last:], engine, pad - last//4), ctx, engine)
+
+def SHA256(data: Data, engine: Engine=UINT32) -> str:
     """
     '256-bit Secure Hash Algorithm' (SHA-256)
 
     Computes the hash of a piece of data. SHA-256 receives data to hash and
     creates 512-bit message blocks from the input. From the message blocks,
-    a message schedule is created which contains 64 words (each 32-bit). This
-    message schedule is sent to the compression function where each word in the
-    schedule is then compressed into eight state registers. The context
+    a message schedule is created which contains 64 words (each 32-bit). Each
+    word of the schedule is generated as the compression function consumes it
+    and is compressed into eight state registers. The context
     returned from a previous compression is then used for the next round of
     compression.
 
     Args:
-        data: (str) The input data.
+        data: (Data) The input data; any bytes-like object, or a string
+            (hashed as its UTF-8 encoding).
+        engine: (Engine) The word engine to run on. Defaults to the
+            integer-backed engine; pass 'engines.UBITARRAY32' to run on the
+            reference list-of-bits implementation.
 
     Returns:
         (str) The hexadecimal digest of the hashed data.
 
     """
 
-    msg = []
-    for e in data:
-        # convert chars to binary in 8-bit 
-        chbin = prepad(binary(ASCII[e]), to=8)
-        msg.extend(chbin)
-    
-    # get length (in bits) of input
-    datalen = binary(len(msg))
-    if len(datalen) > 64:
-        raise ValueError("input is too large")
+    view = _view(data)
+    tail = bytearray()
 
-    # pad out message to factor of 512 (512-bit blocks)
-    tail = [0]*(64-len(datalen)) + datalen
-    padding = [1] + [0]*(511-((len(msg)+len(tail)) % 512))
-    msg += (padding + tail)
-    
     ctx = None
-    for i in range(0, len(msg), 512):
-        block = msg[i:i+512] 
-        wds = [UBitArray32(block[i:i+32]) for i in range(0, 512, 32)]
-        wds = schedule(wds)
+    for block in _split(tail, view):
         # set context for next block
-        ctx = compress(wds, ctx)
+        ctx = process_block(_words(block, engine), ctx, engine)
+    ctx = _finish(tail, len(view), ctx, engine)
 
     hexdigest = "".join(x.tohex() for x in ctx)
     return hexdigest 
+
+
+class Sha256:
+    """
+    A streaming, hashlib-style SHA-256 hasher. Data is fed in pieces through
+    'update'; each full 512-bit block is compressed as soon as it is
+    available, so only the chained compression context, a partial-block
+    buffer and the running length are held between calls.
+
+    Example:
+        >>> h = Sha256()
+        >>> h.update("ab")
+        >>> h.update("c")
+        >>> h.hexdigest()
+        'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad'
+
+    """
+
+    name = "sha256"
+    digest_size = 32
+    block_size = 64
+
+    def __init__(self, data: Data=b"", engine: Engine=UINT32) -> None:
+        """
+        Args:
+            data: (Data) Optional initial data, passed to 'update'.
+            engine: (Engine) The word engine to run on.
+
+        """
+
+        self.engine = engine
+        self._ctx = None
+        self._buf = bytearray()
+        self._len = 0
+        self.update(data)
+
+    @classmethod
+    def frommidstate(cls, ctx: Tuple, length: int, engine: Engine=UINT32) -> "Sha256":
+        """
+        Creates a hasher that resumes from a midstate, the compression
+        context after a whole number of blocks.
+
+        Args:
+            ctx: (Tuple) The context after the first 'length' bytes.
+            length: (int) The number of bytes already compressed into 'ctx'.
+            engine: (Engine) The engine the words of 'ctx' belong to.
+
+        Returns:
+            (Sha256) The resumed hasher.
+
+        Raises:
+            (ValueError) Raised if 'length' is not a multiple of 64.
+
+        """
+
+        if length % 64:
+            raise ValueError("midstate length must be a multiple of 64 bytes")
+        h = cls(engine=engine)
+        h._ctx = ctx
+        h._len = length
+        return h
+
+    def midstate(self) -> Tuple[Tuple, int]:
+        """
+        Returns:
+            (Tuple[Tuple, int]) The compression context and the number of
+                bytes compressed into it, to be passed to 'frommidstate'.
+
+        Raises:
+            (ValueError) Raised if a partial block is buffered.
+
+        """
+
+        if self._buf:
+            raise ValueError("midstate is only available on a block boundary")
+        return self._ctx, self._len
+
+    def _compress(self, block) -> None:
+        # compresses one 64-byte block into the running context
+        self._ctx = process_block(_words(block, self.engine), self._ctx, self.engine)
+
+    def update(self, data: Data) -> None:
+        """
+        Feeds more data into the hasher. Full blocks are compressed straight
+        out of the input buffer; only a trailing partial block is copied.
+
+        Args:
+            data: (Data) The data to append to the message; any bytes-like
+                object, or a string (hashed as its UTF-8 encoding).
+
+        """
+
+        view = _view(data)
+        self._len += len(view)
+        for block in _split(self._buf, view):
+            self._compress(block)
+
+    def _final(self) -> Tuple:
+        # compresses the padded tail on top of the running context, which is
+        # left untouched
+        return _finish(self._buf, self._len, self._ctx, self.engine)
+
+    def digest(self) -> bytes:
+        """
+        Returns:
+            (bytes) The 32-byte digest of the data passed so far. The hasher
+                itself is left unchanged and can keep receiving data.
+
+        """
+
+        result = bytearray()
+        for wd in self._final():
+            n = wd.toint()
+            result += bytes((n >> shift) & 0xff for shift in (24, 16, 8, 0))
+        return bytes(result)
+
+    def hexdigest(self) -> str:
+        """
+        Returns:
+            (str) The hexadecimal digest of the data passed so far. The
+                hasher itself is left unchanged.
+
+        """
+
+        return "".join(wd.tohex() for wd in self._final())
+
+    def copy(self) -> "Sha256":
+        """
+        Forks the hasher. The compression context is shared (words are never
+        mutated), so only the partial-block buffer is copied.
+
+        Returns:
+            (Sha256) An independent hasher with the same state.
+
+        """
+
+        other = self.__class__.__new__(self.__class__)
+        other.engine = self.engine
+        other._ctx = self._ctx
+        other._buf = bytearray(self._buf)
+        other._len = self._len
+        return other
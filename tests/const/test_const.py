@@ -0,0 +1,55 @@
+from sha256.const import H, K, k_words, h_words, cached_word
+from sha256.core.ubitarray_32 import UBitArray32
+from sha256.core.uint_32 import UInt32
+from sha256.sha256 import SHA256, _padding_schedule
+from sha256.core.engines import UBITARRAY32, UINT32
+import pytest
+
+def test_k_words():
+    for word in (UBitArray32, UInt32):
+        words = k_words(word)
+        assert [w.toint() for w in words] == list(K)
+        assert all(isinstance(w, word) for w in words)
+        # built once and shared
+        assert k_words(word) is words
+
+def test_h_words():
+    for word in (UBitArray32, UInt32):
+        words = h_words(word)
+        assert [w.toint() for w in words] == list(H)
+        assert h_words(word) is words
+
+def test_cached_word():
+    a = cached_word(UBitArray32, 0x80000000)
+    assert a.toint() == 0x80000000
+    assert cached_word(UBitArray32, 0x80000000) is a
+    assert cached_word(UInt32, 0x80000000) is not a
+
+def test_shared_words_are_not_mutated_by_hashing():
+    SHA256("abc", UBITARRAY32)
+    SHA256(b"\x00" * 200, UBITARRAY32)
+    assert [w.toint() for w in k_words(UBitArray32)] == list(K)
+    assert [w.toint() for w in h_words(UBitArray32)] == list(H)
+    assert cached_word(UBitArray32, 0).toint() == 0
+
+@pytest.mark.parametrize("word", [UBitArray32, UInt32])
+def test_shared_words_reject_mutation(word):
+    shared = [k_words(word)[0], h_words(word)[0], cached_word(word, 0)]
+    shared += _padding_schedule(512, UBITARRAY32 if word is UBitArray32 else UINT32)[-1:]
+    one = word.fromint(1)
+    for w in shared:
+        before = w.toint()
+        with pytest.raises(TypeError, match="immutable"):
+            w += one
+        with pytest.raises(TypeError, match="immutable"):
+            w ^= one
+        with pytest.raises(TypeError, match="immutable"):
+            w.add_into(one, one)
+        with pytest.raises(TypeError, match="immutable"):
+            w.rotr_into(one, 1)
+        assert w.toint() == before
+        # copies are mutable
+        c = w.copy()
+        c += one
+        assert c.toint() == (before + 1) & 0xffffffff
+    assert SHA256("abc") == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
@@ -1,4 +1,4 @@
-from sha256.core.bitops import binary, prepad, add, twos
+from sha256.core.bitops import binary, prepad, add, add_many, twos
 
 def test_binary():
     result = binary(0)
@@ -47,3 +47,12 @@ def test_twos():
     result = twos([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,1,1,0,1,1,1,1,0,1,0])
     expected = [1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,0,0,1,0,0,0,0,1,1,0]
     assert result == expected
+
+def test_add_many():
+    # the sum is truncated to the operand length
+    operands = [[1,1,1,1], [0,0,0,1], [0,1,1,0], [1,0,1,1], [0,0,1,1]]
+    assert add_many(*operands) == [0,1,0,0]  # (15+1+6+11+3) % 16 = 4
+
+    assert add_many([0,1,0,1]) == [0,1,0,1]
+    assert add_many([0,1,0,1], [0,0,1,1]) == [1,0,0,0]
+    assert add_many([1,1,1,1], [0,0,0,1]) == [0,0,0,0]
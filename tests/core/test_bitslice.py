@@ -0,0 +1,34 @@
+from sha256.core.bitslice import pack, unpack, add, rotr, rshift, constant, hash_padded
+from sha256.sha256 import SHA256, blocks
+
+def test_pack_unpack_roundtrip():
+    block_a = bytes(range(64))
+    block_b = bytes(range(64, 128))
+    result = unpack(pack([block_a, block_b]), 2)
+    expected = [block_a.hex(), block_b.hex()]
+    assert result == expected
+
+def test_add():
+    x = [a | b for a, b in zip(constant(0xffffffff, 0b01), constant(8, 0b10))]
+    y = [a | b for a, b in zip(constant(2, 0b01), constant(27, 0b10))]
+    result = unpack([add(x, y)], 2)
+    expected = ["00000001", "00000023"]
+    assert result == expected
+
+def test_rotr():
+    x = constant(0xe0cf1fcc, 0b1)
+    result = unpack([rotr(x, 40)], 1)
+    expected = ["cce0cf1f"]
+    assert result == expected
+
+def test_rshift():
+    x = constant(0xe0cf1fcc, 0b1)
+    result = unpack([rshift(x, n) for n in (0, 4, 32, 40)], 1)
+    expected = ["e0cf1fcc0e0cf1fc0000000000000000"]
+    assert result == expected
+
+def test_hash_padded():
+    msgs = [b"abc", b"abd", b"\xff" * 55, b"", b"x"]
+    result = hash_padded([b"".join(blocks([msg])) for msg in msgs])
+    expected = [SHA256(msg) for msg in msgs]
+    assert result == expected
@@ -0,0 +1,19 @@
+from sha256.core.lanes import hash_padded, schedule_lanes
+from sha256.core.engines import UINT32
+from sha256.sha256 import SHA256, schedule, blocks, _words
+import pytest
+
+np = pytest.importorskip("numpy")
+
+def test_schedule_lanes_matches_schedule():
+    block = bytes(next(blocks([b"abc"])))
+    wds = np.frombuffer(block, dtype=">u4").astype(np.uint32)[:, None]
+    result = [int(w) for w in schedule_lanes(wds)[:, 0]]
+    expected = [w.toint() for w in schedule(_words(block, UINT32))]
+    assert result == expected
+
+def test_hash_padded():
+    msgs = [b"abc", b"abd", b"\xff" * 55]
+    result = hash_padded([b"".join(blocks([msg])) for msg in msgs])
+    expected = [SHA256(msg) for msg in msgs]
+    assert result == expected
@@ -1,4 +1,5 @@
 from sha256.core.ubitarray_32 import UBitArray32, xor, ch, maj, lsig0, lsig1, usig0, usig1
+from sha256.core.ubitarray_32 import ch_into, maj_into, usig0_into, usig1_into
 import pytest
 
 def test___init___with_greater_than_32_bits():
@@ -204,3 +205,111 @@ def test_usig1():
     result = usig1(a)
     expected = [0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,0,0,0]
     assert result.bits == expected
+
+def test_compact_storage():
+    a = UBitArray32.fromint(10)
+    assert not hasattr(a, "__dict__")
+    assert isinstance(a.bits, list)
+    assert list(a) == a.bits
+
+def test___iadd__():
+    a = UBitArray32.fromint(0xffffffff)
+    b = a
+    a += UBitArray32.fromint(2)
+    assert a is b
+    assert a.toint() == 1
+
+def test___ixor__():
+    a = UBitArray32.fromint(0b1100)
+    b = a
+    a ^= UBitArray32.fromint(0b1010)
+    assert a is b
+    assert a.toint() == 0b0110
+
+def test_add_into():
+    a = UBitArray32.fromint(0)
+    result = a.add_into(UBitArray32.fromint(152), UBitArray32.fromint(83))
+    assert result is a
+    assert a.toint() == 235
+
+def test_add_into_many():
+    values = (0x12345678, 0x9abcdef0, 0xffffffff, 0x80000001, 7)
+    a = UBitArray32.fromint(1)
+    result = a.add_into(a, *(UBitArray32.fromint(n) for n in values))
+    assert result is a
+    assert a.toint() == (1 + sum(values)) & 0xffffffff
+
+def test_into_variants():
+    x = UBitArray32.fromint(0x1bc38230)
+    y = UBitArray32.fromint(0xe0cf1fcc)
+    z = UBitArray32.fromint(0x6a09e667)
+    dst = UBitArray32.fromint(0)
+    assert ch_into(dst, x, y, z) is dst and dst == ch(x, y, z)
+    assert maj_into(dst, x, y, z) is dst and dst == maj(x, y, z)
+    assert usig0_into(dst, x) is dst and dst == usig0(x)
+    assert usig1_into(dst, x) is dst and dst == usig1(x)
+    assert x.toint() == 0x1bc38230
+
+def test_rotr_into():
+    a = UBitArray32.fromint(0)
+    src = UBitArray32.fromint(0xe0cf1fcc)
+    a.rotr_into(src, 40)
+    assert a.toint() == 0xcce0cf1f
+    assert src.toint() == 0xe0cf1fcc
+
+def test_copy():
+    a = UBitArray32.fromint(10)
+    b = a.copy()
+    b += UBitArray32.fromint(1)
+    assert a.toint() == 10
+    assert b.toint() == 11
+
+def test_fused_sigmas_match_rotations():
+    # the table-driven kernels must agree with the composed rotr/rshift/xor
+    for n in (0, 1, 0x80000000, 0xffffffff, 0x12345678, 0xdeadbeef):
+        a = UBitArray32.fromint(n)
+        assert lsig0(a) == xor(a.rotr(7), a.rotr(18), a.rshift(3))
+        assert lsig1(a) == xor(a.rotr(17), a.rotr(19), a.rshift(10))
+        assert usig0(a) == xor(a.rotr(2), a.rotr(13), a.rotr(22))
+        assert usig1(a) == xor(a.rotr(6), a.rotr(11), a.rotr(25))
+
+def test_truth_table_ch_maj_match_bitwise_definitions():
+    for x, y, z in ((0x12345678, 0x9abcdef0, 0x0f0f3c3c), (0, 0xffffffff, 0x55555555), (0xffffffff, 0, 0xaaaaaaaa)):
+        a, b, c = UBitArray32.fromint(x), UBitArray32.fromint(y), UBitArray32.fromint(z)
+        assert ch(a, b, c).toint() == (x & y) ^ (~x & z) & 0xffffffff
+        assert maj(a, b, c).toint() == (x & y) ^ (x & z) ^ (y & z)
+
+def test_add_many():
+    values = (0x12345678, 0x9abcdef0, 0xffffffff, 0x80000001, 7)
+    words = [UBitArray32.fromint(n) for n in values]
+    assert UBitArray32.add_many(*words).toint() == sum(values) % 2**32
+    assert UBitArray32.add_many(words[0]) == words[0]
+    # the operands are left untouched
+    assert [w.toint() for w in words] == list(values)
+
+def test_bits_setter():
+    a = UBitArray32.fromint(0)
+    bits = a.bits
+    bits[0] = 1
+    assert a.toint() == 0
+    a.bits = bits
+    assert a.toint() == 0x80000000
+
+    a.bits = [1, 1]
+    assert a.toint() == 3
+    with pytest.raises(ValueError, match="cannot create empty UBitArray32"):
+        a.bits = []
+
+def test_freeze():
+    a = UBitArray32.fromint(7)
+    frozen = a.freeze()
+    a += UBitArray32.fromint(1)
+    assert frozen.toint() == 7
+    assert frozen.freeze() is frozen
+    with pytest.raises(TypeError, match="FrozenUBitArray32 is immutable"):
+        frozen.bits = [1]
+    with pytest.raises(TypeError):
+        ch_into(frozen, a, a, a)
+    assert frozen.toint() == 7
+    assert frozen.tohex() == "00000007"
+    assert type(frozen.copy()) is UBitArray32
@@ -0,0 +1,154 @@
+from sha256.core.uint_32 import UInt32, xor, ch, maj, lsig0, lsig1, usig0, usig1
+from sha256.core.uint_32 import ch_into, maj_into, usig0_into, usig1_into
+from sha256.core.uint_32 import compress_block, expand, rounds, toints, tobytes
+from sha256.const import H, K
+import hashlib
+from sha256.core.ubitarray_32 import UBitArray32
+import sha256.core.ubitarray_32 as reference
+import pytest
+
+def test___init___masks_to_32_bits():
+    result = UInt32(0x1ffffffff).value
+    expected = 0xffffffff
+    assert result == expected
+
+def test_from_int_with_negative_int():
+    # -24 (signed) -> 4294967272 (unsigned)
+    result = UInt32.fromint(-24).toint()
+    expected = 4294967272
+    assert result == expected
+
+def test_from_int_exceeding_max_value():
+    with pytest.raises(ValueError, match="maximum value of \\(2\\*\\*32\\)-1, or 4294967295, exceeded"):
+        UInt32.fromint(4294967296)
+
+def test_tohex():
+    result = UInt32(0x0000ae1f).tohex()
+    expected = "0000ae1f"
+    assert result == expected
+
+    result = UInt32(0x9ca6a411).tohex()
+    expected = "9ca6a411"
+    assert result == expected
+
+def test_rshift():
+    result = UInt32(0b1111110001).rshift(3).toint()
+    expected = 0b1111110
+    assert result == expected
+
+    result = UInt32(0b10101111).rshift(46).toint()
+    expected = 0
+    assert result == expected
+
+def test_rotr():
+    result = UInt32(0b1010101010100011).rotr(3)
+    expected = UInt32(0b01100000000000000001010101010100)
+    assert result == expected
+
+    result = UInt32(0xe0cf1fcc).rotr(40)
+    expected = UInt32(0xcce0cf1f)
+    assert result == expected
+
+    result = UInt32(0xe0cf1fcc).rotr(0)
+    expected = UInt32(0xe0cf1fcc)
+    assert result == expected
+
+def test___add___wraps_around():
+    result = UInt32(0xffffffff) + UInt32(2)
+    expected = UInt32(1)
+    assert result == expected
+
+def test___str__():
+    result = str(UInt32(10))
+    expected = "00000000000000000000000000001010"
+    assert result == expected
+
+def test___repr__():
+    result = repr(UInt32(10))
+    expected = "UInt32[0x0000000a]"
+    assert result == expected
+
+@pytest.mark.parametrize("fn, ref", [
+    (lsig0, reference.lsig0),
+    (lsig1, reference.lsig1),
+    (usig0, reference.usig0),
+    (usig1, reference.usig1),
+])
+def test_sigma_matches_reference(fn, ref):
+    for n in (0, 1, 0x3fff, 0x9ca6a411, 0xffffffff):
+        result = fn(UInt32(n)).toint()
+        expected = ref(UBitArray32.fromint(n)).toint()
+        assert result == expected
+
+@pytest.mark.parametrize("fn, ref", [
+    (xor, reference.xor),
+    (ch, reference.ch),
+    (maj, reference.maj),
+])
+def test_ternary_matches_reference(fn, ref):
+    a, b, c = 0x00e4fa65, 0x18819569, 0x0a678169
+    result = fn(UInt32(a), UInt32(b), UInt32(c)).toint()
+    expected = ref(UBitArray32.fromint(a), UBitArray32.fromint(b), UBitArray32.fromint(c)).toint()
+    assert result == expected
+
+def test_in_place_operations():
+    a = UInt32(0xffffffff)
+    b = a
+    a += UInt32(2)
+    a ^= UInt32(0b11)
+    assert a is b
+    assert a.toint() == 0b10
+
+    assert a.add_into(UInt32(152), UInt32(83)).toint() == 235
+    assert a.add_into(a, UInt32(0xffffffff), UInt32(2)).toint() == 236
+    assert a.rotr_into(UInt32(0xe0cf1fcc), 40).toint() == 0xcce0cf1f
+
+    c = a.copy()
+    c += UInt32(1)
+    assert c.toint() == a.toint() + 1
+
+def test_into_variants():
+    x, y, z = UInt32(0x1bc38230), UInt32(0xe0cf1fcc), UInt32(0x6a09e667)
+    dst = UInt32(0)
+    assert ch_into(dst, x, y, z) is dst and dst == ch(x, y, z)
+    assert maj_into(dst, x, y, z) is dst and dst == maj(x, y, z)
+    assert usig0_into(dst, x) is dst and dst == usig0(x)
+    assert usig1_into(dst, x) is dst and dst == usig1(x)
+
+def test_add_many():
+    values = (0x12345678, 0x9abcdef0, 0xffffffff, 0x80000001, 7)
+    result = UInt32.add_many(*(UInt32(n) for n in values))
+    assert result.toint() == sum(values) % 2**32
+
+def test_toints_tobytes():
+    data = bytes(range(32))
+    wds = toints(data)
+    assert wds[0] == 0x00010203 and wds[-1] == 0x1c1d1e1f
+    assert tobytes(wds) == data
+
+def test_compress_block():
+    # 'abc', padded by hand
+    w = toints(b"abc\x80" + bytes(59) + b"\x18") + [0]*48
+    ctx = list(H)
+    compress_block(ctx, w)
+    assert tobytes(ctx) == hashlib.sha256(b"abc").digest()
+
+def test_rounds_split():
+    # running the rounds in two parts is the same as running them at once
+    w = toints(b"abc\x80" + bytes(59) + b"\x18") + [0]*48
+    expand(w)
+    kw = [k + x for k, x in zip(K, w)]
+    assert rounds(rounds(H, kw[:10]), kw[10:]) == rounds(H, kw)
+
+def test_freeze():
+    a = UInt32(7)
+    frozen = a.freeze()
+    a += UInt32(1)
+    assert frozen.toint() == 7
+    assert frozen.freeze() is frozen
+    with pytest.raises(TypeError, match="FrozenUInt32 is immutable"):
+        frozen.value = 0
+    with pytest.raises(TypeError, match="FrozenUInt32 is immutable"):
+        ch_into(frozen, a, a, a)
+    assert (frozen + UInt32(1)).toint() == 8
+    assert type(frozen.copy()) is UInt32
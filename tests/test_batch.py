@@ -0,0 +1,44 @@
+from sha256.batch import hash_many, hash_lanes, hash_bitsliced
+from sha256.sha256 import SHA256
+import pytest
+
+MSGS = [bytes([i]) * i for i in range(100)]
+
+def test_hash_many_keeps_order():
+    result = list(hash_many(MSGS, workers=2, chunksize=7))
+    expected = [SHA256(msg) for msg in MSGS]
+    assert result == expected
+
+def test_hash_many_in_process():
+    result = list(hash_many(iter(["abc", memoryview(b"abc")]), workers=1))
+    expected = ["ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"] * 2
+    assert result == expected
+
+def test_hash_many_with_memoryview():
+    result = list(hash_many([memoryview(b"abc")], workers=2))
+    expected = ["ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"]
+    assert result == expected
+
+def test_hash_many_with_invalid_chunksize():
+    with pytest.raises(ValueError, match="chunksize must be at least 1"):
+        hash_many(MSGS, chunksize=0)
+
+def test_hash_lanes():
+    pytest.importorskip("numpy")
+    msgs = [bytes([i % 251]) * i for i in range(200)] + ["abc"]
+    result = hash_lanes(msgs)
+    expected = [SHA256(msg) for msg in msgs]
+    assert result == expected
+
+def test_hash_lanes_with_small_lanes_max():
+    pytest.importorskip("numpy")
+    msgs = ["abc", "", "abc"]
+    result = hash_lanes(msgs, lanes_max=1)
+    expected = [SHA256(msg) for msg in msgs]
+    assert result == expected
+
+def test_hash_bitsliced():
+    msgs = [bytes([i % 251]) * i for i in range(150)] + ["abc"]
+    result = hash_bitsliced(msgs, lanes_max=64)
+    expected = [SHA256(msg) for msg in msgs]
+    assert result == expected
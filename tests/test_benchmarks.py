@@ -0,0 +1,61 @@
+from benchmarks import macro, memory, micro
+from sha256.core.engines import ENGINES
+from benchmarks.__main__ import main
+import hashlib
+import json
+
+def _report(**medians):
+    return {"meta": {}, "results": {name: {"median": t} for name, t in medians.items()}}
+
+def test_benchmarks_cover_primitives():
+    names = micro.benchmarks()
+    for name in ("bitops.add", "bitops.twos", "bitops.binary", "ubitarray32.fromint",
+                 "ubitarray32.compress", "uint32.schedule", "SHA256.uint32.1024",
+                 "fixed.hash32", "fixed.hash64", "raw.compress_block.32", "raw.compress_block.64"):
+        assert name in names
+
+def test_run():
+    report = micro.run(["uint32.rotr"], repeat=2, warmup=0, min_time=0.001)
+    result = sorted(report["results"])
+    expected = ["uint32.rotr"]
+    assert result == expected
+    assert report["results"]["uint32.rotr"]["median"] > 0
+
+def test_compare():
+    rows = micro.compare(_report(a=1.0, b=1.0, c=1.0), _report(a=1.05, b=1.5, d=1.0), threshold=0.1)
+    result = [(row["name"], row["regressed"]) for row in rows]
+    expected = [("a", False), ("b", True)]
+    assert result == expected
+
+def test_main_compare(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(_report(a=1.0)))
+    current = tmp_path / "current.json"
+    current.write_text(json.dumps(_report(a=2.0)))
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert main(["compare", str(baseline), str(current), "--threshold", "1.5"]) == 0
+
+def test_macro_workloads_are_correct():
+    report = macro.run(engines=["uint32"], scale=0.0001)
+    result = {name: stats["correct"] for name, stats in report["results"].items()}
+    expected = {"million-a.uint32": True, "long-message.uint32": True, "monte-carlo.uint32": True}
+    assert result == expected
+
+def test_macro_full_size_vectors():
+    # the published full-size digests, checked against hashlib
+    assert macro.MILLION_A_DIGEST == hashlib.sha256(b"a" * 10**6).hexdigest()
+    assert macro.MONTE_DIGEST == macro._monte(100)(None, hashlib.sha256)
+    assert macro.million_a().expected == macro.MILLION_A_DIGEST
+    assert macro.monte_carlo().expected == macro.MONTE_DIGEST
+
+def test_memory_profile():
+    result = memory.profile(1024, ENGINES["uint32"], limit=3)
+    assert result["peak"] > 0
+    assert result["words_per_block"] > 0
+    assert 0 < len(result["sites"]) <= 3
+    assert all(site["site"].startswith("sha256") for site in result["sites"])
+
+def test_memory_budget():
+    report = memory.run([1024], budget=0.0)
+    assert report["results"]["uint32.1024"]["within_budget"] is False
+    assert main(["memory", "--size", "1024", "--budget", "0"]) == 1
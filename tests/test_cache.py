@@ -0,0 +1,57 @@
+from sha256.cache import MidstateCache, CacheInfo
+from sha256.sha256 import SHA256
+import pytest
+
+HEADER = bytes(range(128))
+
+def test_hexdigest_matches_SHA256():
+    cache = MidstateCache()
+    for body in (b"", b"abc", b"x" * 200):
+        result = cache.hexdigest(HEADER + body)
+        expected = SHA256(HEADER + body)
+        assert result == expected
+
+def test_resumes_from_longest_prefix():
+    cache = MidstateCache(depth=2)
+    cache.hexdigest(HEADER + b"abc")
+    result = cache.info()
+    expected = CacheInfo(hits=0, misses=1, evictions=0, maxsize=128, currsize=2)
+    assert result == expected
+
+    result = cache.hexdigest(HEADER + b"abd")
+    expected = SHA256(HEADER + b"abd")
+    assert result == expected
+    assert cache.info().hits == 1
+
+def test_short_messages_bypass_cache():
+    cache = MidstateCache()
+    cache.hexdigest(b"abc")
+    result = cache.info()
+    expected = CacheInfo(hits=0, misses=0, evictions=0, maxsize=128, currsize=0)
+    assert result == expected
+
+def test_lru_eviction():
+    cache = MidstateCache(maxsize=2, depth=1)
+    a, b, c = (bytes([i]) * 64 + b"tail" for i in range(3))
+    cache.hexdigest(a)
+    cache.hexdigest(b)
+    cache.hexdigest(a)
+    cache.hexdigest(c)  # evicts 'b', the least recently used
+    assert cache.info() == CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
+
+    cache.hexdigest(a)
+    assert cache.info().hits == 2
+    cache.hexdigest(b)
+    assert cache.info().misses == 4
+
+def test_clear():
+    cache = MidstateCache()
+    cache.hexdigest(HEADER)
+    cache.clear()
+    result = cache.info()
+    expected = CacheInfo(hits=0, misses=0, evictions=0, maxsize=128, currsize=0)
+    assert result == expected
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError, match="maxsize and depth must be at least 1"):
+        MidstateCache(maxsize=0)
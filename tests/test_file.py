@@ -0,0 +1,126 @@
+from sha256.file import hash_file, hash_stream
+from sha256.sha256 import SHA256
+from sha256.__main__ import main
+import sha256.file
+import io
+import sys
+
+DATA = bytes(range(256)) * 40
+
+def test_hash_file(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(DATA)
+    result = hash_file(str(path))
+    expected = SHA256(DATA)
+    assert result == expected
+
+def test_hash_file_with_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(sha256.file, "MMAP_THRESHOLD", 1)
+    path = tmp_path / "data.bin"
+    path.write_bytes(DATA)
+    result = hash_file(str(path))
+    expected = SHA256(DATA)
+    assert result == expected
+
+def test_hash_stream_with_small_chunks(monkeypatch):
+    monkeypatch.setattr(sha256.file, "CHUNK_SIZE", 100)
+    result = hash_stream(io.BytesIO(DATA))
+    expected = SHA256(DATA)
+    assert result == expected
+
+def test_main(tmp_path, capsys):
+    path = tmp_path / "abc.txt"
+    path.write_bytes(b"abc")
+    result = main([str(path)])
+    expected = 0
+    assert result == expected
+
+    result = capsys.readouterr().out
+    expected = f"ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad  {path}\n"
+    assert result == expected
+
+def test_main_check(tmp_path, capsys):
+    good = tmp_path / "good.txt"
+    good.write_bytes(b"abc")
+    bad = tmp_path / "bad.txt"
+    bad.write_bytes(b"abd")
+    listing = tmp_path / "SHA256SUMS"
+    listing.write_text(
+        f"ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad  {good}\n"
+        f"ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad *{bad}\n"
+    )
+    result = main(["-c", str(listing)])
+    expected = 1
+    assert result == expected
+
+    captured = capsys.readouterr()
+    assert captured.out == f"{good}: OK\n{bad}: FAILED\n"
+    assert "1 computed checksum did NOT match" in captured.err
+
+def test_hash_stream_buffer_is_sized_to_the_file(tmp_path):
+    class Reader(io.BytesIO):
+        def readinto(self, view):
+            sizes.append(len(view))
+            return super().readinto(view)
+
+    sizes = []
+    result = hash_stream(Reader(DATA), size=len(DATA))
+    assert result == SHA256(DATA)
+    assert set(sizes) == {len(DATA)}
+
+    sizes.clear()
+    hash_stream(Reader(DATA))
+    assert set(sizes) == {sha256.file.CHUNK_SIZE}
+
+def test_hash_file_passes_its_size(tmp_path, monkeypatch):
+    path = tmp_path / "data.bin"
+    path.write_bytes(DATA)
+    calls = []
+    monkeypatch.setattr(sha256.file, "hash_stream", lambda f, engine, size=0: calls.append(size))
+    hash_file(str(path))
+    assert calls == [len(DATA)]
+
+def _listing(tmp_path, text):
+    good = tmp_path / "good.txt"
+    good.write_bytes(b"abc")
+    listing = tmp_path / "SHA256SUMS"
+    listing.write_bytes(text.format(good=good).encode())
+    return good, str(listing)
+
+ABC = "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+
+def test_main_check_malformed_lines_only_warn(tmp_path, capsys):
+    good, listing = _listing(tmp_path, f"{ABC}  {{good}}\nnot a checksum line\n")
+    result = main(["-c", listing])
+    expected = 0
+    assert result == expected
+
+    captured = capsys.readouterr()
+    assert captured.out == f"{good}: OK\n"
+    assert "1 line is improperly formatted" in captured.err
+
+    result = main(["-c", "--strict", listing])
+    expected = 1
+    assert result == expected
+
+def test_main_check_without_formatted_lines(tmp_path, capsys):
+    _, listing = _listing(tmp_path, "not a checksum line\n")
+    result = main(["-c", "--status", listing])
+    expected = 1
+    assert result == expected
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert f"{listing}: no properly formatted checksum lines found" in captured.err
+
+def test_main_check_crlf_listing(tmp_path, capsys, monkeypatch):
+    # a stream that, unlike open(), does not translate line endings
+    good = tmp_path / "good.txt"
+    good.write_bytes(b"abc")
+    monkeypatch.setattr(sys, "stdin", io.StringIO(f"{ABC}  {good}\r\n"))
+    result = main(["-c", "-"])
+    expected = 0
+    assert result == expected
+
+    captured = capsys.readouterr()
+    assert captured.out == f"{good}: OK\n"
@@ -0,0 +1,30 @@
+from sha256.fixed import hash32, hash64
+import hashlib
+import pytest
+
+def test_hash32():
+    for seed in (b"", b"a", b"abc"):
+        data = hashlib.sha256(seed).digest()
+        assert hash32(data) == hashlib.sha256(data).digest()
+    assert hash32(bytes(32)) == hashlib.sha256(bytes(32)).digest()
+    assert hash32(b"\xff" * 32) == hashlib.sha256(b"\xff" * 32).digest()
+
+def test_hash64():
+    for seed in (b"", b"a", b"abc"):
+        data = hashlib.sha256(seed).digest() + hashlib.sha256(seed + b"!").digest()
+        assert hash64(data) == hashlib.sha256(data).digest()
+    assert hash64(bytes(64)) == hashlib.sha256(bytes(64)).digest()
+    assert hash64(b"\xff" * 64) == hashlib.sha256(b"\xff" * 64).digest()
+
+def test_buffer_types():
+    data = bytes(range(64))
+    expected = hashlib.sha256(data).digest()
+    assert hash64(bytearray(data)) == expected
+    assert hash64(memoryview(data)) == expected
+    assert hash32(memoryview(data)[:32]) == hashlib.sha256(data[:32]).digest()
+
+def test_wrong_length():
+    with pytest.raises(ValueError, match="exactly 32 bytes"):
+        hash32(bytes(31))
+    with pytest.raises(ValueError, match="exactly 64 bytes"):
+        hash64(bytes(32))
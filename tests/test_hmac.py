@@ -0,0 +1,47 @@
+from sha256.hmac import HMAC, hmac_sha256
+import hashlib
+import hmac as py_hmac
+import pytest
+
+# RFC 4231 test vectors
+@pytest.mark.parametrize("key, msg, expected", [
+    (b"\x0b" * 20, b"Hi There",
+     "b0344c61d8db38535ca8afceaf0bf12b881dc200c9833da726e9376c2e32cff7"),
+    (b"Jefe", b"what do ya want for nothing?",
+     "5bdcc146bf60754e6a042426089575c75a003f089d2739839dec58b964ec3843"),
+    (b"\xaa" * 131, b"Test Using Larger Than Block-Size Key - Hash Key First",
+     "60e431591ee0b67f0d8a26aacbf5b77f8e0bc6213728c5140546040f0ee37f54"),
+])
+def test_hmac_sha256(key, msg, expected):
+    result = hmac_sha256(key, msg)
+    assert result == expected
+
+def test_hmac_in_pieces():
+    mac = HMAC(b"Jefe")
+    mac.update(b"what do ya ")
+    mac.update(b"want for nothing?")
+    result = mac.hexdigest()
+    expected = "5bdcc146bf60754e6a042426089575c75a003f089d2739839dec58b964ec3843"
+    assert result == expected
+
+def test_hmac_copy_reuses_key():
+    mac = HMAC(b"Jefe")
+    a = mac.copy()
+    a.update(b"what do ya want for nothing?")
+    b = mac.copy()
+    b.update(b"Hi There")
+    assert a.hexdigest() == hmac_sha256(b"Jefe", b"what do ya want for nothing?")
+    assert b.hexdigest() == hmac_sha256(b"Jefe", b"Hi There")
+    assert mac.digest() == bytes.fromhex(hmac_sha256(b"Jefe", b""))
+
+def test_midstates_after_update():
+    mac = HMAC(b"Jefe", b"data")
+    with pytest.raises(ValueError, match="midstates are only available before update"):
+        mac.midstates()
+
+def test_init_with_array_like_buffer():
+    np = pytest.importorskip("numpy")
+    msg = np.arange(100, dtype=np.uint8)
+    result = HMAC(b"key", msg).hexdigest()
+    expected = py_hmac.new(b"key", bytes(range(100)), hashlib.sha256).hexdigest()
+    assert result == expected
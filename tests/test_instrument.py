@@ -0,0 +1,55 @@
+from sha256.instrument import instrument
+from sha256.core.engines import UBITARRAY32, UINT32
+from sha256.core.ubitarray_32 import UBitArray32
+from sha256.sha256 import SHA256, Sha256, compress, schedule
+import sha256.sha256
+import pytest
+
+def test_instrument_counts():
+    with instrument() as report:
+        result = SHA256("abc", UBITARRAY32)
+    expected = "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    assert result == expected
+
+    counts = report.counts
+    assert counts["blocks"] == 1
+    # one multi-operand add per schedule word, 4 adds per round (one of them
+    # multi-operand), 8 final adds
+    assert counts["adds"] == 48 + 64*4 + 8
+    # 48 schedule words of 2 sigmas each, 64 rounds of 2 sigmas
+    assert counts["sigmas"] == 48*2 + 64*2
+    assert counts["words"] > 0
+
+@pytest.mark.parametrize("engine", [UBITARRAY32, UINT32])
+def test_compress_reuses_buffers(engine):
+    wds = schedule([engine.word.fromint(i) for i in range(16)], engine)
+    compress(wds, None, engine)
+    with instrument() as report:
+        compress(wds, None, engine)
+    # the 8 private registers and 5 temporaries; nothing per round
+    assert report.counts["words"] == 8 + 5
+
+def test_instrument_stages():
+    with instrument() as report:
+        Sha256(b"x" * 100, UINT32).hexdigest()
+    stages = report.as_dict()["stages"]
+    assert stages["compress"]["calls"] == 2
+    # the schedule is generated inside compress, not by a separate pass
+    assert stages["schedule"]["calls"] == 0
+    assert stages["words"]["calls"] == 2
+    assert stages["padding"]["calls"] == 1
+    assert stages["tohex"]["calls"] == 8
+    assert stages["compress"]["seconds"] > 0
+
+def test_instrument_restores_originals():
+    add, compress = UBitArray32.__add__, sha256.sha256.compress
+    with instrument():
+        assert UBitArray32.__add__ is not add
+    assert UBitArray32.__add__ is add
+    assert sha256.sha256.compress is compress
+
+def test_instrument_cannot_nest():
+    with instrument():
+        with pytest.raises(RuntimeError, match="instrumentation is already active"):
+            with instrument():
+                pass
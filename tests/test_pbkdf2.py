@@ -0,0 +1,25 @@
+from sha256.pbkdf2 import pbkdf2_hmac_sha256
+import hashlib
+import pytest
+
+@pytest.mark.parametrize("password, salt, iterations, dklen", [
+    (b"password", b"salt", 1, 32),
+    (b"password", b"salt", 2, 32),
+    (b"password", b"salt", 4096, 32),
+    (b"passwordPASSWORDpassword", b"saltSALTsaltSALTsaltSALTsaltSALTsalt", 4096, 40),
+    (b"pass\0word", b"sa\0lt", 4096, 16),
+    (b"k" * 100, b"salt", 3, 70),
+])
+def test_pbkdf2_hmac_sha256(password, salt, iterations, dklen):
+    result = pbkdf2_hmac_sha256(password, salt, iterations, dklen)
+    expected = hashlib.pbkdf2_hmac("sha256", password, salt, iterations, dklen)
+    assert result == expected
+
+def test_pbkdf2_hmac_sha256_in_parallel():
+    result = pbkdf2_hmac_sha256("password", "salt", 100, 96, workers=2)
+    expected = hashlib.pbkdf2_hmac("sha256", b"password", b"salt", 100, 96)
+    assert result == expected
+
+def test_pbkdf2_hmac_sha256_with_invalid_iterations():
+    with pytest.raises(ValueError, match="iterations must be at least 1"):
+        pbkdf2_hmac_sha256(b"password", b"salt", 0)
@@ -0,0 +1,44 @@
+from sha256.pow import sha256d, search_nonce
+from sha256.core.engines import UBITARRAY32
+import hashlib
+import pytest
+
+HEADER = bytes(range(80))
+
+def _sha256d(data):
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()
+
+def test_sha256d():
+    result = sha256d(b"abc")
+    expected = _sha256d(b"abc").hex()
+    assert result == expected
+    assert sha256d(b"abc", UBITARRAY32) == expected
+
+def test_search_nonce_finds_first_match():
+    target = 2**252
+    result = search_nonce(HEADER, target, 0, 200)
+    expected = next(
+        n for n in range(200)
+        if int.from_bytes(_sha256d(HEADER[:76] + n.to_bytes(4, "little")), "little") <= target
+    )
+    assert result.nonce == expected
+    assert result.hash == _sha256d(HEADER[:76] + expected.to_bytes(4, "little")).hex()
+    assert result.hashes == expected + 1
+    assert result.rate > 0
+
+def test_search_nonce_without_match():
+    result = search_nonce(HEADER, 0, 10, 30)
+    assert result.nonce is None
+    assert result.hash is None
+    assert result.hashes == 20
+
+def test_search_nonce_in_parallel():
+    target = 2**252
+    result = search_nonce(HEADER, target, 0, 200, workers=2)
+    expected = search_nonce(HEADER, target, 0, 200)
+    assert result.nonce == expected.nonce
+    assert result.hash == expected.hash
+
+def test_search_nonce_with_invalid_header():
+    with pytest.raises(ValueError, match="header must be 80 bytes"):
+        search_nonce(HEADER[:79], 0)
@@ -1,21 +1,145 @@
-from sha256.sha256 import SHA256
+from sha256.sha256 import SHA256, _split, blocks, schedule, compress, rolling_schedule, process_block, _padding_schedule
+from sha256.const import cached_word
+from sha256.core.engines import ENGINES
+import hashlib
+import pytest
 
-def test_with_0_bits():
-    result = SHA256("")
+@pytest.fixture(params=sorted(ENGINES))
+def engine(request):
+    return ENGINES[request.param]
+
+def test_with_0_bits(engine):
+    result = SHA256("", engine)
     expected = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
     assert result == expected
 
-def test_with_24_bits():
-    result = SHA256("abc")
+def test_with_24_bits(engine):
+    result = SHA256("abc", engine)
     expected = "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
     assert result == expected
 
-def test_with_488_bits():
-    result = SHA256("abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq")
+def test_with_488_bits(engine):
+    result = SHA256("abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq", engine)
     expected ="248d6a61d20638b8e5c026930c3e6039a33ce45964ff2167f6ecedd419db06c1"
     assert result == expected
 
-def test_with_896_bits():
-    result = SHA256("abcdefghbcdefghicdefghijdefghijkefghijklfghijklmghijklmnhijklmnoijklmnopjklmnopqklmnopqrlmnopqrsmnopqrstnopqrstu")
+def test_with_896_bits(engine):
+    result = SHA256("abcdefghbcdefghicdefghijdefghijkefghijklfghijklmghijklmnhijklmnoijklmnopjklmnopqklmnopqrlmnopqrsmnopqrstnopqrstu", engine)
     expected = "cf5b16a778af8380036ce59e7b0492370b249b11e8f07a51afac45037afee9d1"
     assert result == expected
+
+def test_with_bytes(engine):
+    result = SHA256(b"abc", engine)
+    expected = "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    assert result == expected
+
+def test_with_buffer_types():
+    expected = SHA256(b"\x00\xff" * 100)
+    assert SHA256(bytearray(b"\x00\xff" * 100)) == expected
+    assert SHA256(memoryview(b"\x00\xff" * 100)) == expected
+    assert SHA256(memoryview(b"\x00\xff" * 100).cast("H")) == expected
+
+def test_with_binary_data():
+    result = SHA256(bytes(range(256)))
+    expected = "40aff2e9d2d8922e47afd4648e6967497158785fbd1da870e7110266bf944880"
+    assert result == expected
+
+def test_with_non_ascii_text():
+    result = SHA256("héllo")
+    expected = SHA256("héllo".encode("utf-8"))
+    assert result == expected
+
+def test_blocks_padding():
+    result = [bytes(block) for block in blocks([b"abc"])]
+    expected = [b"abc\x80" + bytes(52) + b"\x00\x00\x00\x00\x00\x00\x00\x18"]
+    assert result == expected
+
+    # 56 bytes leave no room for the length; a second block is added
+    result = [len(block) for block in blocks([b"a"*56])]
+    expected = [64, 64]
+    assert result == expected
+
+    result = [len(block) for block in blocks([])]
+    expected = [64]
+    assert result == expected
+
+def test_blocks_with_uneven_chunks():
+    data = bytes(range(256)) * 2
+    chunks = (data[i:i+j] for i, j in zip(range(0, 512, 37), [37]*14))
+    result = [bytes(block) for block in blocks(chunks)]
+    expected = [bytes(block) for block in blocks([data])]
+    assert result == expected
+
+def test_compress_does_not_mutate_context(engine):
+    wds = schedule([engine.word.fromint(i) for i in range(16)], engine)
+    ctx = compress(wds, None, engine)
+    before = [w.toint() for w in ctx]
+    compress(wds, ctx, engine)
+    after = [w.toint() for w in ctx]
+    assert before == after
+
+def test_rolling_schedule_matches_schedule(engine):
+    block = [engine.word.fromint((i * 0x9e3779b9) & 0xffffffff) for i in range(16)]
+    rolled = [w.toint() for w in rolling_schedule(block, engine)]
+    assert len(block) == 16
+    assert rolled == [w.toint() for w in schedule(list(block), engine)]
+
+def test_process_block_matches_compress(engine):
+    block = [engine.word.fromint((i * 0x9e3779b9) & 0xffffffff) for i in range(16)]
+    ctx = compress(schedule(list(block), engine), None, engine)
+    expected = [w.toint() for w in compress(schedule(list(block), engine), ctx, engine)]
+    assert [w.toint() for w in process_block(block, ctx, engine)] == expected
+
+def test_padding_only_final_blocks(engine):
+    # lengths around the boundaries where the last block is padding only
+    for n in (0, 55, 56, 63, 64, 119, 120, 128):
+        data = bytes(range(n))
+        assert SHA256(data, engine) == hashlib.sha256(data).hexdigest()
+
+def test_padding_schedule_is_cached_by_length():
+    _padding_schedule.cache_clear()
+    for _ in range(3):
+        SHA256(b"k" * 64)
+        SHA256(b"p" * 4096)
+    info = _padding_schedule.cache_info()
+    assert (info.misses, info.hits) == (2, 4)
+    # a last block with room for the length is not looked up
+    SHA256(b"x" * 70)
+    assert _padding_schedule.cache_info().misses == 2
+
+def test_only_padding_words_are_memoized():
+    cached_word.cache_clear()
+    data = bytes((i * 7919) & 0xff for i in range(4096 + 20))
+    assert SHA256(data) == hashlib.sha256(data).digest().hex()
+    # the last block holds 5 message words, then the '1' bit and zero words
+    # and the two length words; the message words are built directly
+    assert cached_word.cache_info().currsize == 3
+
+def test_compress_requires_64_words(engine):
+    block = [engine.word.fromint(i) for i in range(16)]
+    with pytest.raises(ValueError, match="exactly 64 words"):
+        compress(block, None, engine)
+    wds = schedule(list(block), engine)
+    with pytest.raises(ValueError, match="exactly 64 words"):
+        compress(wds + wds[:1], None, engine)
+
+def test_engine_is_inferred_from_words(engine):
+    # the baseline signatures, which take no engine
+    block = [engine.word.fromint((i * 0x9e3779b9) & 0xffffffff) for i in range(16)]
+    expected = [w.toint() for w in compress(schedule(list(block), engine), None, engine)]
+    assert [w.toint() for w in compress(schedule(list(block)))] == expected
+    assert [w.toint() for w in compress(rolling_schedule(block))] == expected
+    assert [w.toint() for w in process_block(block)] == expected
+    with pytest.raises(ValueError, match="exactly 64 words"):
+        compress([])
+
+def test_split_tops_up_the_partial_block():
+    buf = bytearray(b"a" * 10)
+    view = memoryview(b"b" * 200)
+    result = list(_split(buf, view))
+    assert [bytes(block) for block in result] == [b"a"*10 + b"b"*54, b"b"*64, b"b"*64]
+    # full blocks of the input are not copied
+    assert isinstance(result[1], memoryview)
+    assert buf == b"b" * 18
+    assert list(_split(buf, memoryview(b"c"))) == []
+    assert buf == b"b" * 18 + b"c"
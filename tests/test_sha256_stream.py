@@ -0,0 +1,73 @@
+from sha256.sha256 import Sha256, SHA256
+import pytest
+
+MSG = "abcdefghbcdefghicdefghijdefghijkefghijklfghijklmghijklmnhijklmnoijklmnopjklmnopqklmnopqrlmnopqrsmnopqrstnopqrstu"
+
+def test_hexdigest_matches_SHA256():
+    for n in (0, 3, 55, 56, 63, 64, 65, len(MSG)):
+        result = Sha256(MSG[:n]).hexdigest()
+        expected = SHA256(MSG[:n])
+        assert result == expected
+
+@pytest.mark.parametrize("size", [1, 7, 63, 64, 65])
+def test_update_in_pieces(size):
+    h = Sha256()
+    for i in range(0, len(MSG), size):
+        h.update(MSG[i:i+size])
+    result = h.hexdigest()
+    expected = "cf5b16a778af8380036ce59e7b0492370b249b11e8f07a51afac45037afee9d1"
+    assert result == expected
+
+def test_digest():
+    result = Sha256("abc").digest()
+    expected = bytes.fromhex("ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad")
+    assert result == expected
+
+def test_digest_does_not_change_state():
+    h = Sha256("ab")
+    h.hexdigest()
+    h.update("c")
+    result = h.hexdigest()
+    expected = "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    assert result == expected
+
+def test_copy():
+    h = Sha256(MSG[:70])
+    other = h.copy()
+    other.update(MSG[70:])
+    assert h.hexdigest() == SHA256(MSG[:70])
+    assert other.hexdigest() == SHA256(MSG)
+
+def test_update_with_memoryview_slices():
+    data = bytes(range(256)) * 3
+    view = memoryview(data)
+    h = Sha256()
+    for i in range(0, len(data), 100):
+        h.update(view[i:i+100])
+    result = h.hexdigest()
+    expected = SHA256(data)
+    assert result == expected
+
+def test_frommidstate():
+    ctx, length = Sha256(MSG[:64]).midstate()
+    h = Sha256.frommidstate(ctx, length)
+    h.update(MSG[64:])
+    result = h.hexdigest()
+    expected = SHA256(MSG)
+    assert result == expected
+
+def test_midstate_off_block_boundary():
+    with pytest.raises(ValueError, match="midstate is only available on a block boundary"):
+        Sha256("abc").midstate()
+
+def test_frommidstate_with_invalid_length():
+    with pytest.raises(ValueError, match="midstate length must be a multiple of 64 bytes"):
+        Sha256.frommidstate(None, 3)
+
+def test_init_with_array_like_buffer():
+    # objects whose truth value is ambiguous are still just buffers
+    np = pytest.importorskip("numpy")
+    data = np.arange(100, dtype=np.uint8)
+    result = Sha256(data).hexdigest()
+    expected = SHA256(bytes(range(100)))
+    assert result == expected